@@ -1,4 +1,5 @@
 """Codex Lifecycle Agent - AI-powered software development lifecycle automation."""
 
-__version__ = "0.1.0"
+from ._version import __version__
+
 __author__ = "jnibarger01"
@@ -0,0 +1,3 @@
+"""Package version, kept import-free so the CLI can report it cheaply."""
+
+__version__ = "0.1.0"
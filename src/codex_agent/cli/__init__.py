@@ -1 +1,21 @@
 """CLI interface components."""
+
+import sys
+
+
+def run() -> None:
+    """
+    Console entry point.
+
+    Handles ``codex --version`` before importing typer, rich, or pydantic so
+    the most common "is it installed?" check stays fast.
+    """
+    if sys.argv[1:] == ["--version"]:
+        from .._version import __version__
+
+        sys.stdout.write(f"Codex Lifecycle Agent v{__version__}\n")
+        return
+
+    from .main import app
+
+    app()
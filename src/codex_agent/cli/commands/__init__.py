@@ -0,0 +1,4 @@
+"""CLI subcommands, imported on demand by :class:`~codex_agent.cli.main.LazyGroup`.
+
+Each module exposes a ``cmd`` attribute holding its Click command.
+"""
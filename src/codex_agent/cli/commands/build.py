@@ -0,0 +1,26 @@
+"""``codex build`` - execute implementation tasks."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import typer
+
+from ..common import get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("build")
+def build(
+    subcommand: str = typer.Argument("next", help="Subcommand: next, task <id>, all"),
+    task_id: Optional[str] = typer.Option(None, "--task", help="Specific task ID"),
+    verbose: bool = verbose_option,
+) -> None:
+    """Execute implementation tasks."""
+    get_console().print(f"[yellow]Build command not yet implemented: {subcommand}[/yellow]")
+    # TODO: Implement build logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,58 @@
+"""``codex config`` - manage configuration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..common import config_option, get_console, get_err_console, load_config
+
+app = typer.Typer(name="config", help="Manage configuration")
+
+
+@app.command("show")
+def config_show(
+    config_path: Optional[Path] = config_option,
+) -> None:
+    """Show current configuration."""
+    from ...utils import serialization
+
+    try:
+        config = load_config(config_path)
+    except Exception as e:
+        get_err_console().print(f"Error: {e}")
+        raise typer.Exit(1)
+
+    # Plain stdout rather than Rich: no markup/highlighting pass and no
+    # line wrapping, so the output stays valid JSON when piped.
+    typer.echo(serialization.dumps(config.model_dump(mode="json", exclude_none=True), indent=True))
+
+
+@app.command("set")
+def config_set(
+    key: str = typer.Argument(..., help="Config key (e.g., llm.model)"),
+    value: str = typer.Argument(..., help="Config value"),
+    config_path: Optional[Path] = config_option,
+) -> None:
+    """Set configuration value."""
+    get_console().print("[yellow]Config set not yet implemented[/yellow]")
+    # TODO: Implement config set
+    raise typer.Exit(1)
+
+
+@app.command("validate")
+def config_validate(
+    config_path: Optional[Path] = config_option,
+) -> None:
+    """Validate configuration."""
+    try:
+        load_config(config_path)
+        get_console().print("[green]✓[/green] Configuration is valid")
+    except Exception as e:
+        get_err_console().print(f"[red]✗[/red] Configuration is invalid: {e}")
+        raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,31 @@
+"""``codex deploy`` - deploy to environments."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import dry_run_option, get_console, get_err_console, verbose_option
+
+# Deploy targets accepted on the command line
+_VALID_ENVS = frozenset({"staging", "prod"})
+
+app = typer.Typer()
+
+
+@app.command("deploy")
+def deploy(
+    environment: str = typer.Argument(..., help="Environment: staging or prod"),
+    verbose: bool = verbose_option,
+    dry_run: bool = dry_run_option,
+) -> None:
+    """Deploy to environments."""
+    if environment not in _VALID_ENVS:
+        get_err_console().print("Error: Environment must be 'staging' or 'prod'")
+        raise typer.Exit(2)
+
+    get_console().print(f"[yellow]Deploy command not yet implemented: {environment}[/yellow]")
+    # TODO: Implement deployment logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,23 @@
+"""``codex history`` - show the audit log."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import get_console, json_output_option
+
+app = typer.Typer()
+
+
+@app.command("history")
+def history(
+    limit: int = typer.Option(10, "--limit", "-n", help="Number of events to show"),
+    json_output: bool = json_output_option,
+) -> None:
+    """Show audit log."""
+    get_console().print("[yellow]History command not yet implemented[/yellow]")
+    # TODO: Implement history logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
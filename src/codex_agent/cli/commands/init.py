@@ -0,0 +1,57 @@
+"""``codex init`` - initialize the agent in the current directory."""
+
+from __future__ import annotations
+
+import typer
+
+from ...core.config import Config, ProjectConfig
+from ..common import (
+    DEFAULT_CODEX_DIR,
+    DEFAULT_CONFIG_PATH,
+    dry_run_option,
+    get_console,
+    verbose_option,
+)
+
+app = typer.Typer()
+
+
+@app.command("init")
+def init(
+    project_name: str = typer.Argument(..., help="Project name"),
+    stack: str = typer.Option("python-postgres", help="Technology stack"),
+    verbose: bool = verbose_option,
+    dry_run: bool = dry_run_option,
+) -> None:
+    """Initialize Codex agent in the current directory."""
+    from rich.panel import Panel
+
+    console = get_console()
+    console.print(Panel.fit(f"🚀 Initializing Codex agent for [bold]{project_name}[/bold]"))
+
+    if dry_run:
+        console.print("[yellow]DRY RUN - No changes will be made[/yellow]")
+
+    codex_dir = DEFAULT_CODEX_DIR
+
+    if codex_dir.exists() and not dry_run:
+        if not typer.confirm("Codex directory already exists. Reinitialize?"):
+            raise typer.Exit(0)
+
+    if not dry_run:
+        project_config = ProjectConfig(name=project_name, stack=stack)
+        config = Config(project=project_config, codex_dir=codex_dir)
+
+        # Create directory structure and initial config
+        config.ensure_directories()
+        config.save_to_file(DEFAULT_CONFIG_PATH)
+
+        console.print("[green]✓[/green] Codex agent initialized successfully")
+        console.print(f"  Config saved to: {DEFAULT_CONFIG_PATH}")
+    else:
+        console.print("[yellow]Would create:[/yellow]")
+        console.print(f"  - {codex_dir}/")
+        console.print(f"  - {DEFAULT_CONFIG_PATH}")
+
+
+cmd = typer.main.get_command(app)
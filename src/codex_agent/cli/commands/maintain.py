@@ -0,0 +1,23 @@
+"""``codex maintain`` - maintenance operations."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("maintain")
+def maintain(
+    subcommand: str = typer.Argument("upgrade", help="Subcommand: upgrade, patch, refactor"),
+    verbose: bool = verbose_option,
+) -> None:
+    """Maintenance operations."""
+    get_console().print(f"[yellow]Maintain command not yet implemented: {subcommand}[/yellow]")
+    # TODO: Implement maintenance logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,23 @@
+"""``codex observe`` - monitor the running application."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("observe")
+def observe(
+    subcommand: str = typer.Argument("status", help="Subcommand: status, logs, metrics"),
+    verbose: bool = verbose_option,
+) -> None:
+    """Monitor running application."""
+    get_console().print(f"[yellow]Observe command not yet implemented: {subcommand}[/yellow]")
+    # TODO: Implement observability logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
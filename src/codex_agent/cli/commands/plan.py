@@ -0,0 +1,27 @@
+"""``codex plan`` - PRD ingestion and planning."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..common import get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("plan")
+def plan(
+    subcommand: str = typer.Argument("generate", help="Subcommand: generate, show, approve, revise"),
+    prd_file: Optional[Path] = typer.Option(None, "--prd", help="Path to PRD file"),
+    verbose: bool = verbose_option,
+) -> None:
+    """PRD ingestion and planning."""
+    get_console().print(f"[yellow]Plan command not yet implemented: {subcommand}[/yellow]")
+    # TODO: Implement planning logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
@@ -0,0 +1,23 @@
+"""``codex scaffold`` - create project structure."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import dry_run_option, get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("scaffold")
+def scaffold(
+    verbose: bool = verbose_option,
+    dry_run: bool = dry_run_option,
+) -> None:
+    """Create project structure and scaffolding."""
+    get_console().print("[yellow]Scaffold command not yet implemented[/yellow]")
+    # TODO: Implement scaffolding logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
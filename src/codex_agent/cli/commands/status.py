@@ -0,0 +1,53 @@
+"""``codex status`` - show agent status and progress."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..common import config_option, get_console, get_err_console, json_output_option, load_config
+
+app = typer.Typer()
+
+
+@app.command("status")
+def status(
+    config_path: Optional[Path] = config_option,
+    json_output: bool = json_output_option,
+) -> None:
+    """Show current agent status and progress."""
+    try:
+        config = load_config(config_path)
+
+        if json_output:
+            # Machine-readable output never goes through Rich
+            from ...utils import serialization
+
+            status_data = {
+                "state": "IDLE",  # TODO: Load from persistence
+                "project": config.project.name,
+                "stack": config.project.stack,
+            }
+            typer.echo(serialization.dumps(status_data, indent=True))
+        else:
+            from rich.table import Table
+
+            table = Table(title="Codex Agent Status")
+            table.add_column("Property", style="cyan")
+            table.add_column("Value", style="green")
+
+            table.add_row("Project", config.project.name)
+            table.add_row("Stack", config.project.stack)
+            table.add_row("State", "IDLE")  # TODO: Load from persistence
+            table.add_row("Config", str(config.codex_dir / "config.yaml"))
+
+            get_console().print(table)
+
+    except Exception as e:
+        get_err_console().print(f"Error: {e}")
+        raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
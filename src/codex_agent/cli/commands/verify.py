@@ -0,0 +1,23 @@
+"""``codex verify`` - run tests and validation."""
+
+from __future__ import annotations
+
+import typer
+
+from ..common import get_console, verbose_option
+
+app = typer.Typer()
+
+
+@app.command("verify")
+def verify(
+    subcommand: str = typer.Argument("run", help="Subcommand: run, fix, report"),
+    verbose: bool = verbose_option,
+) -> None:
+    """Run tests and validation."""
+    get_console().print(f"[yellow]Verify command not yet implemented: {subcommand}[/yellow]")
+    # TODO: Implement verification logic
+    raise typer.Exit(1)
+
+
+cmd = typer.main.get_command(app)
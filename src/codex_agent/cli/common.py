@@ -0,0 +1,65 @@
+"""Shared CLI helpers: consoles, common options, and config loading."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import typer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..core.config import Config
+
+# Default state locations, relative to the working directory
+DEFAULT_CODEX_DIR = Path(".codex")
+DEFAULT_CONFIG_PATH = DEFAULT_CODEX_DIR / "config.yaml"
+
+# Rich consoles are created on first use so that commands which never render
+# anything (e.g. --version, --help) don't pay for importing rich.
+_console: Optional[Console] = None
+_err_console: Optional[Console] = None
+
+# Global options
+verbose_option = typer.Option(False, "--verbose", "-v", help="Enable verbose output")
+quiet_option = typer.Option(False, "--quiet", "-q", help="Suppress non-essential output")
+dry_run_option = typer.Option(False, "--dry-run", help="Show what would happen without executing")
+config_option = typer.Option(None, "--config", help="Path to config file")
+no_color_option = typer.Option(False, "--no-color", help="Disable colored output")
+json_output_option = typer.Option(False, "--json", help="Output in JSON format")
+
+
+def get_console() -> Console:
+    """Get the stdout console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def get_err_console() -> Console:
+    """Get the stderr console, creating it on first use."""
+    global _err_console
+    if _err_console is None:
+        from rich.console import Console
+
+        _err_console = Console(stderr=True, style="red")
+    return _err_console
+
+
+def load_config(config_path: Optional[Path] = None) -> Config:
+    """Load configuration from file or defaults."""
+    from ..core.config import Config
+
+    if config_path is None:
+        config_path = DEFAULT_CONFIG_PATH
+
+    try:
+        return Config.load_from_file(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Config file not found: {config_path}. Run 'codex init' to initialize."
+        ) from None
@@ -2,14 +2,149 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import fnmatch
+import logging
+import math
+import os
+import re
+import threading
+from functools import cached_property, lru_cache
+from pathlib import Path, PurePath
 from typing import Any, Optional
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from ..utils import serialization
+from ..utils.regex_lint import has_nested_unbounded_repeat
+
+logger = logging.getLogger(__name__)
+
+# Subdirectories of the Codex state directory
+_CODEX_SUBDIRS = ("checkpoints", "logs", "cache", "artifacts")
 
-class LLMConfig(BaseSettings):
+# Parsed configs keyed by resolved path. Each entry records the file's
+# (st_mtime_ns, st_size, st_ino) stamp so an edit invalidates it.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int, int], type, Config]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Leading global inline flags, e.g. the "(?i)" in "(?i)api[_-]?key"
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+# A numbered backreference or group condition (\1, (?(1)...)) not itself
+# escaped. Group numbers shift once a pattern is fused with others.
+_NUMBERED_REF_RE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?\(\d)")
+
+
+@lru_cache(maxsize=64)
+def _fuse_secret_patterns(patterns: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """
+    Fuse secret patterns into one alternation of ``_secret<i>`` named groups.
+
+    A leading global flag group such as ``(?i)`` is rewritten as a scoped
+    group so it keeps applying to its own pattern only; under ``x`` the
+    scoped group closes on a new line, so a trailing comment can't swallow
+    it.
+
+    Args:
+        patterns: Patterns that each compile on their own
+
+    Returns:
+        Compiled pattern, or None when there are no patterns or they can't
+        share one alternation (numbered backreferences, clashing group names)
+    """
+    if not patterns or any(_NUMBERED_REF_RE.search(pattern) for pattern in patterns):
+        return None
+
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        flags = _GLOBAL_FLAGS_RE.match(pattern)
+        if flags:
+            end = "\n)" if "x" in flags.group(1) else ")"
+            pattern = f"(?{flags.group(1)}:{pattern[flags.end():]}{end}"
+        alternatives.append(f"(?P<_secret{i}>{pattern})")
+    try:
+        return re.compile("|".join(alternatives))
+    except re.error as e:
+        logger.debug("Scanning secret patterns one by one, they can't be fused: %s", e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader_dumper() -> tuple[Any, Any]:
+    """Get the fastest available safe YAML loader/dumper (libyaml when built in)."""
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+
+        return CSafeLoader, CSafeDumper
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+        return SafeLoader, SafeDumper
+
+
+def _json_cache_path(config_path: Path) -> Path:
+    """Get the path of the precompiled JSON copy of a YAML config."""
+    return config_path.with_name(f"{config_path.name}.json")
+
+
+def _read_json_cache(config_path: Path, stamp: tuple[int, int, int]) -> Optional[dict[str, Any]]:
+    """
+    Read the JSON copy of a config if it was compiled from the current YAML.
+
+    Args:
+        config_path: Path to the YAML config
+        stamp: Current (st_mtime_ns, st_size, st_ino) of the YAML file
+
+    Returns:
+        Parsed config data, or None if the copy is missing or stale
+    """
+    try:
+        cached = serialization.loads(_json_cache_path(config_path).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("source") != list(stamp):
+        return None
+    return cached.get("data")
+
+
+def _is_json_native(value: Any) -> bool:
+    """Check that a parsed YAML value survives a JSON round trip unchanged."""
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_native(v) for k, v in value.items())
+    # dates, timestamps, sets, binary, ...
+    return False
+
+
+def _write_json_cache(
+    config_path: Path, stamp: tuple[int, int, int], config_data: dict[str, Any]
+) -> None:
+    """Write the JSON copy of a config, tagged with the YAML file's stamp."""
+    cache_path = _json_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+
+    try:
+        tmp_path.write_bytes(serialization.dumpb({"source": list(stamp), "data": config_data}))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+class _SectionConfig(BaseModel):
+    """Base for config sections; read-only once loaded, like Config itself."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class LLMConfig(_SectionConfig):
     """LLM provider configuration."""
 
     provider: str = Field(default="openai", description="LLM provider (openai, anthropic, etc.)")
@@ -19,11 +154,12 @@ class LLMConfig(BaseSettings):
     temperature: float = Field(default=0.1, ge=0.0, le=2.0, description="Sampling temperature")
     timeout_seconds: int = Field(default=120, description="Request timeout")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
-
-    model_config = SettingsConfigDict(env_prefix="CODEX_LLM_")
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, description="Maximum LLM requests in flight for batch execution"
+    )
 
 
-class GitProviderConfig(BaseSettings):
+class GitProviderConfig(_SectionConfig):
     """Git provider configuration."""
 
     type: str = Field(default="github", description="Provider type (github, gitlab, etc.)")
@@ -32,29 +168,23 @@ class GitProviderConfig(BaseSettings):
     token: Optional[str] = Field(default=None, description="Access token")
     base_url: Optional[str] = Field(default=None, description="API base URL for self-hosted")
 
-    model_config = SettingsConfigDict(env_prefix="CODEX_GIT_")
-
 
-class CIProviderConfig(BaseSettings):
+class CIProviderConfig(_SectionConfig):
     """CI provider configuration."""
 
     type: str = Field(default="github-actions", description="CI provider type")
     config_path: str = Field(default=".github/workflows", description="CI config file path")
 
-    model_config = SettingsConfigDict(env_prefix="CODEX_CI_")
-
 
-class HostingProviderConfig(BaseSettings):
+class HostingProviderConfig(_SectionConfig):
     """Hosting provider configuration."""
 
     type: str = Field(default="railway", description="Hosting provider (railway, fly.io, vercel)")
     api_key: Optional[str] = Field(default=None, description="Provider API key")
     project_id: Optional[str] = Field(default=None, description="Project identifier")
 
-    model_config = SettingsConfigDict(env_prefix="CODEX_HOSTING_")
 
-
-class SecurityPolicyConfig(BaseSettings):
+class SecurityPolicyConfig(_SectionConfig):
     """Security policy configuration."""
 
     secret_scanning: bool = Field(default=True, description="Enable secret scanning")
@@ -70,8 +200,71 @@ class SecurityPolicyConfig(BaseSettings):
     dependency_audit: bool = Field(default=True, description="Enable dependency audit")
     fail_on_severity: str = Field(default="high", description="Minimum severity to fail (low, medium, high, critical)")
 
-
-class QualityPolicyConfig(BaseSettings):
+    @field_validator("secret_patterns")
+    @classmethod
+    def _check_secret_patterns(cls, patterns: list[str]) -> list[str]:
+        """Reject invalid patterns and ones prone to catastrophic backtracking."""
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid secret pattern {pattern!r}: {e}") from e
+            if has_nested_unbounded_repeat(pattern):
+                raise ValueError(
+                    f"Secret pattern {pattern!r} nests unbounded repeats and may "
+                    "backtrack catastrophically"
+                )
+        # Settle at load time whether the patterns fuse; if not they are
+        # scanned one by one, so engine construction never fails on it
+        _fuse_secret_patterns(tuple(patterns))
+        return patterns
+
+    @cached_property
+    def secret_pattern_groups(self) -> dict[str, str]:
+        """Name identifying each of ``secret_patterns``, as a group in the fused pattern."""
+        return {f"_secret{i}": pattern for i, pattern in enumerate(self.secret_patterns)}
+
+    @cached_property
+    def compiled_secret_patterns(self) -> dict[str, re.Pattern[str]]:
+        """Each of ``secret_patterns`` compiled on its own, by group name."""
+        return {name: re.compile(pattern) for name, pattern in self.secret_pattern_groups.items()}
+
+    @cached_property
+    def compiled_secret_pattern(self) -> Optional[re.Pattern[str]]:
+        """
+        All ``secret_patterns`` fused into a single alternation.
+
+        Content is scanned once instead of once per pattern. Each alternative
+        is a named group from ``secret_pattern_groups``, so ``match.lastgroup``
+        identifies the pattern that matched.
+
+        Returns:
+            Compiled pattern, or None when no patterns are configured or they
+            can't be fused; use ``compiled_secret_patterns`` then
+        """
+        return _fuse_secret_patterns(tuple(self.secret_patterns))
+
+    @cached_property
+    def compiled_secret_pattern_bytes(self) -> Optional[re.Pattern[bytes]]:
+        """
+        The fused secret pattern compiled for bytes, to scan files in place.
+
+        Character classes and ``(?i)`` only cover ASCII in this form.
+
+        Returns:
+            Compiled pattern, or None when no patterns are configured or
+            they use flags that are only valid for str patterns
+        """
+        pattern = self.compiled_secret_pattern
+        if pattern is None:
+            return None
+        try:
+            return re.compile(pattern.pattern.encode())
+        except re.error:
+            return None
+
+
+class QualityPolicyConfig(_SectionConfig):
     """Quality policy configuration."""
 
     test_coverage_enabled: bool = Field(default=True, description="Enable coverage checks")
@@ -82,7 +275,7 @@ class QualityPolicyConfig(BaseSettings):
     lint_blocking: bool = Field(default=True, description="Block on lint failures")
 
 
-class SafetyPolicyConfig(BaseSettings):
+class SafetyPolicyConfig(_SectionConfig):
     """Safety policy configuration."""
 
     max_files_per_task: int = Field(default=10, description="Maximum files modified per task")
@@ -91,9 +284,39 @@ class SafetyPolicyConfig(BaseSettings):
         default_factory=lambda: [".env", "secrets/", "*.pem", "*.key"],
         description="Paths that cannot be modified",
     )
+    fail_fast: bool = Field(
+        default=False,
+        description="Skip per-file safety checks once a file-count or diff-size limit is exceeded",
+    )
 
-
-class PolicyConfig(BaseSettings):
+    @cached_property
+    def compiled_prohibited_paths(
+        self,
+    ) -> tuple[tuple[str, ...], tuple[tuple[bool, tuple[re.Pattern[str], ...]], ...]]:
+        """
+        ``prohibited_paths`` split into substrings and precompiled globs.
+
+        Patterns containing ``*`` are globs with ``Path.match`` semantics:
+        each component is compiled with ``fnmatch.translate`` and matched
+        against the trailing path components (all of them, for an absolute
+        pattern). Other patterns are plain substrings.
+
+        Returns:
+            (substrings, globs) where each glob is (is_absolute, component regexes)
+        """
+        substrings = []
+        globs = []
+        for pattern in self.prohibited_paths:
+            if "*" in pattern:
+                pure = PurePath(pattern)
+                parts = tuple(re.compile(fnmatch.translate(part)) for part in pure.parts)
+                globs.append((pure.is_absolute(), parts))
+            else:
+                substrings.append(pattern)
+        return tuple(substrings), tuple(globs)
+
+
+class PolicyConfig(_SectionConfig):
     """Combined policy configuration."""
 
     security: SecurityPolicyConfig = Field(default_factory=SecurityPolicyConfig)
@@ -101,7 +324,7 @@ class PolicyConfig(BaseSettings):
     safety: SafetyPolicyConfig = Field(default_factory=SafetyPolicyConfig)
 
 
-class PreferencesConfig(BaseSettings):
+class PreferencesConfig(_SectionConfig):
     """User preferences."""
 
     auto_fix_lint: bool = Field(default=True, description="Automatically fix lint issues")
@@ -111,18 +334,21 @@ class PreferencesConfig(BaseSettings):
     auto_deploy: bool = Field(default=False, description="Automatically deploy after verification")
 
 
-class ProjectConfig(BaseSettings):
+class ProjectConfig(_SectionConfig):
     """Project-specific configuration."""
 
     name: str = Field(..., description="Project name")
     stack: str = Field(..., description="Technology stack (node-postgres, python-postgres, etc.)")
     version: str = Field(default="1", description="Config version")
 
-    model_config = SettingsConfigDict(env_prefix="CODEX_PROJECT_")
-
 
 class Config(BaseSettings):
-    """Main configuration."""
+    """
+    Main configuration.
+
+    This is the only settings class: environment variables are read once here
+    and routed to nested sections with ``__``, e.g. ``CODEX_LLM__API_KEY``.
+    """
 
     project: ProjectConfig
     llm: LLMConfig = Field(default_factory=LLMConfig)
@@ -138,24 +364,59 @@ class Config(BaseSettings):
     cache_dir: Path = Field(default=Path(".codex/cache"), description="Cache directory")
 
     model_config = SettingsConfigDict(
+        env_prefix="CODEX_",
         env_file=".env",
         env_file_encoding="utf-8",
         env_nested_delimiter="__",
         extra="ignore",
+        frozen=True,
     )
 
     @classmethod
     def load_from_file(cls, config_path: Path) -> Config:
-        """Load configuration from YAML file."""
-        import yaml
+        """
+        Load configuration from YAML file.
+
+        Results are cached per file and reused until the file's mtime, size,
+        or inode changes. The returned instance is shared between callers and
+        must be treated as read-only.
+
+        Once it validates, the parsed YAML is also written to ``<name>.json``
+        next to the file so later processes can skip YAML parsing while the
+        source is unchanged. Files with values JSON can't represent exactly
+        (e.g. YAML dates) are not cached, so every load sees the same data.
+        """
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+        cache_key = str(config_path.resolve())
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp and cached[1] is cls:
+            return cached[2]
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        config_data = _read_json_cache(config_path, stamp)
+        from_json = config_data is not None
+        if config_data is None:
+            import yaml
 
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f)
+            loader, _ = _yaml_loader_dumper()
+            with open(config_path) as f:
+                config_data = yaml.load(f, Loader=loader)
 
-        return cls(**config_data)
+        config = cls(**config_data)
+
+        if not from_json and _is_json_native(config_data):
+            _write_json_cache(config_path, stamp, config_data)
+
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[cache_key] = (stamp, cls, config)
+
+        return config
 
     def save_to_file(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
@@ -163,16 +424,18 @@ class Config(BaseSettings):
 
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        config_dict = self.model_dump(exclude_none=True)
+        # mode="json" turns Paths into plain strings the safe dumper can represent
+        config_dict = self.model_dump(mode="json", exclude_none=True)
 
+        _, dumper = _yaml_loader_dumper()
         with open(config_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
 
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        self.codex_dir.mkdir(parents=True, exist_ok=True)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        (self.codex_dir / "tasks").mkdir(exist_ok=True)
-        (self.codex_dir / "checkpoints").mkdir(exist_ok=True)
-        (self.codex_dir / "artifacts").mkdir(exist_ok=True)
+        # log_dir and cache_dir usually live under codex_dir; the set dedupes them
+        directories = {self.codex_dir / sub for sub in _CODEX_SUBDIRS}
+        directories.update((self.log_dir, self.cache_dir))
+
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
@@ -2,12 +2,55 @@
 
 from __future__ import annotations
 
+import random
+import time
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
-from uuid import uuid4
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..utils.clock import utcnow
+
+# Masks that turn 128 random bits into an RFC 4122 version 4 UUID
+_UUID4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48)) & ((1 << 128) - 1)
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _new_id() -> str:
+    """
+    Generate a random version 4 UUID string.
+
+    Uses the process-wide Mersenne Twister instead of ``uuid4()``, which
+    reads os.urandom on every call. IDs only need to be unique, not
+    unpredictable, and ``random`` is reseeded in forked children.
+
+    Returns:
+        Canonical 36-character UUID string
+    """
+    h = "%032x" % (random.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Crockford base32, encoded two characters (10 bits) per lookup
+_CROCKFORD32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD32_PAIRS = tuple(a + b for a in _CROCKFORD32 for b in _CROCKFORD32)
+_ULID_SHIFTS = tuple(range(120, -1, -10))
+
+
+def _new_ulid() -> str:
+    """
+    Generate a ULID string.
+
+    A 48-bit millisecond timestamp followed by 80 random bits, so IDs sort
+    by creation time. Encoded here rather than via a ULID package, which
+    is several times slower in pure Python.
+
+    Returns:
+        26-character Crockford base32 ULID
+    """
+    n = (time.time_ns() // 1_000_000) << 80 | random.getrandbits(80)
+    return "".join([_CROCKFORD32_PAIRS[(n >> shift) & 0x3FF] for shift in _ULID_SHIFTS])
 
 
 class LifecycleState(str, Enum):
@@ -91,7 +134,7 @@ class Verification(BaseModel):
 class Task(BaseModel):
     """Task model representing a unit of work."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique task ID")
+    id: str = Field(default_factory=_new_id, description="Unique task ID")
     type: TaskType = Field(..., description="Task type")
     title: str = Field(..., description="Human-readable title")
     description: str = Field(..., description="Detailed task description")
@@ -105,7 +148,7 @@ class Task(BaseModel):
     verification: Optional[Verification] = Field(None, description="Verification specification")
 
     # Audit fields
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     attempts: int = Field(default=0, description="Number of execution attempts")
@@ -114,10 +157,7 @@ class Task(BaseModel):
     # Additional metadata
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional task metadata")
 
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class StateTransition(BaseModel):
@@ -125,7 +165,7 @@ class StateTransition(BaseModel):
 
     from_state: LifecycleState
     to_state: LifecycleState
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     trigger: str = Field(..., description="What triggered this transition")
     metadata: dict[str, Any] = Field(default_factory=dict)
 
@@ -139,24 +179,21 @@ class PolicyViolation(BaseModel):
     message: str
     context: dict[str, Any] = Field(default_factory=dict)
     blocking: bool = Field(default=True, description="Whether this blocks execution")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
 
 
 class AuditEvent(BaseModel):
     """Audit log event."""
 
-    id: str = Field(default_factory=lambda: str(ULID()))
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    id: str = Field(default_factory=_new_ulid)
+    timestamp: datetime = Field(default_factory=utcnow)
     event_type: EventType
     actor: str = Field(..., description="Who/what triggered this event (user, agent, system)")
     event_data: dict[str, Any] = Field(default_factory=dict)
     task_id: Optional[str] = None
     state: Optional[LifecycleState] = None
 
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class Symbol(BaseModel):
@@ -179,29 +216,27 @@ class FileIndex(BaseModel):
     symbols: list[Symbol] = Field(default_factory=list)
     imports: list[str] = Field(default_factory=list)
     exports: list[str] = Field(default_factory=list)
-    last_modified: datetime = Field(default_factory=datetime.utcnow)
+    last_modified: datetime = Field(default_factory=utcnow)
+    mtime_ns: Optional[int] = Field(None, description="File mtime (ns) when indexed")
 
 
 class Checkpoint(BaseModel):
     """State checkpoint for recovery."""
 
-    id: str = Field(default_factory=lambda: str(ULID()))
+    id: str = Field(default_factory=_new_ulid)
     state: LifecycleState
     tasks: list[Task]
     current_task_id: Optional[str] = None
     metadata: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        """Pydantic config."""
+    created_at: datetime = Field(default_factory=utcnow)
 
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class LLMRequest(BaseModel):
     """LLM API request record."""
 
-    id: str = Field(default_factory=lambda: str(ULID()))
+    id: str = Field(default_factory=_new_ulid)
     task_id: str
     model: str
     prompt_tokens: int = 0
@@ -209,7 +244,7 @@ class LLMRequest(BaseModel):
     total_tokens: int = 0
     temperature: float = 0.1
     max_tokens: int = 4000
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     duration_ms: int = 0
     success: bool = True
     error: Optional[str] = None
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from collections import deque
 from typing import Optional
 
 from ..core.config import Config
 from ..core.models import AuditEvent, EventType, LifecycleState, StateTransition, Task
+from ..utils.clock import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 class StateTransitionError(Exception):
     """Raised when an invalid state transition is attempted."""
 
-    pass
+    __slots__ = ()
 
 
 class Orchestrator:
@@ -26,28 +27,41 @@ class Orchestrator:
     state transition rules.
     """
 
-    # Valid state transitions
-    TRANSITIONS = {
-        LifecycleState.IDLE: [LifecycleState.PLANNING],
-        LifecycleState.PLANNING: [LifecycleState.SCAFFOLDING, LifecycleState.FAILED],
-        LifecycleState.SCAFFOLDING: [LifecycleState.BUILDING, LifecycleState.FAILED],
-        LifecycleState.BUILDING: [LifecycleState.VERIFYING, LifecycleState.FAILED],
-        LifecycleState.VERIFYING: [
+    __slots__ = ("config", "current_state", "previous_state", "transition_history", "current_task")
+
+    # Valid state transitions, in display order
+    TRANSITIONS: dict[LifecycleState, tuple[LifecycleState, ...]] = {
+        LifecycleState.IDLE: (LifecycleState.PLANNING,),
+        LifecycleState.PLANNING: (LifecycleState.SCAFFOLDING, LifecycleState.FAILED),
+        LifecycleState.SCAFFOLDING: (LifecycleState.BUILDING, LifecycleState.FAILED),
+        LifecycleState.BUILDING: (LifecycleState.VERIFYING, LifecycleState.FAILED),
+        LifecycleState.VERIFYING: (
             LifecycleState.DEPLOYING,
             LifecycleState.BUILDING,
             LifecycleState.FAILED,
-        ],
-        LifecycleState.DEPLOYING: [LifecycleState.OBSERVING, LifecycleState.FAILED],
-        LifecycleState.OBSERVING: [LifecycleState.MAINTAINING, LifecycleState.IDLE],
-        LifecycleState.MAINTAINING: [
+        ),
+        LifecycleState.DEPLOYING: (LifecycleState.OBSERVING, LifecycleState.FAILED),
+        LifecycleState.OBSERVING: (LifecycleState.MAINTAINING, LifecycleState.IDLE),
+        LifecycleState.MAINTAINING: (
             LifecycleState.BUILDING,
             LifecycleState.OBSERVING,
             LifecycleState.IDLE,
             LifecycleState.FAILED,
-        ],
-        LifecycleState.FAILED: [LifecycleState.IDLE],
+        ),
+        LifecycleState.FAILED: (LifecycleState.IDLE,),
+    }
+
+    # Same transitions as sets, for membership checks
+    _ALLOWED: dict[LifecycleState, frozenset[LifecycleState]] = {
+        state: frozenset(targets) for state, targets in TRANSITIONS.items()
     }
 
+    TERMINAL_STATES = frozenset({LifecycleState.IDLE, LifecycleState.FAILED})
+
+    # Most recent transitions kept in memory; persist them with
+    # StateStore.save_transitions to keep the full history
+    MAX_HISTORY = 1000
+
     def __init__(self, config: Config) -> None:
         """
         Initialize the orchestrator.
@@ -58,7 +72,7 @@ class Orchestrator:
         self.config = config
         self.current_state = LifecycleState.IDLE
         self.previous_state: Optional[LifecycleState] = None
-        self.transition_history: list[StateTransition] = []
+        self.transition_history: deque[StateTransition] = deque(maxlen=self.MAX_HISTORY)
         self.current_task: Optional[Task] = None
 
     def can_transition(self, to_state: LifecycleState) -> bool:
@@ -71,8 +85,7 @@ class Orchestrator:
         Returns:
             True if transition is allowed
         """
-        allowed_states = self.TRANSITIONS.get(self.current_state, [])
-        return to_state in allowed_states
+        return to_state in self._ALLOWED.get(self.current_state, frozenset())
 
     def transition(self, to_state: LifecycleState, trigger: str = "manual") -> StateTransition:
         """
@@ -91,13 +104,13 @@ class Orchestrator:
         if not self.can_transition(to_state):
             raise StateTransitionError(
                 f"Cannot transition from {self.current_state} to {to_state}. "
-                f"Allowed transitions: {self.TRANSITIONS.get(self.current_state, [])}"
+                f"Allowed transitions: {list(self.get_allowed_transitions())}"
             )
 
         transition = StateTransition(
             from_state=self.current_state,
             to_state=to_state,
-            timestamp=datetime.utcnow(),
+            timestamp=utcnow(),
             trigger=trigger,
         )
 
@@ -125,13 +138,13 @@ class Orchestrator:
         """Get current state."""
         return self.current_state
 
-    def get_allowed_transitions(self) -> list[LifecycleState]:
-        """Get list of allowed transitions from current state."""
-        return self.TRANSITIONS.get(self.current_state, [])
+    def get_allowed_transitions(self) -> tuple[LifecycleState, ...]:
+        """Get allowed transitions from current state."""
+        return self.TRANSITIONS.get(self.current_state, ())
 
     def is_terminal_state(self) -> bool:
         """Check if current state is terminal (no automatic transitions)."""
-        return self.current_state in [LifecycleState.IDLE, LifecycleState.FAILED]
+        return self.current_state in self.TERMINAL_STATES
 
     def create_audit_event(self, event_type: EventType, **kwargs: dict) -> AuditEvent:
         """
@@ -153,8 +166,8 @@ class Orchestrator:
         )
 
     def get_transition_history(self) -> list[StateTransition]:
-        """Get history of state transitions."""
-        return self.transition_history.copy()
+        """Get history of state transitions (at most MAX_HISTORY, oldest first)."""
+        return list(self.transition_history)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+import sys
+from array import array
 from collections import defaultdict, deque
-from typing import Optional
+from collections.abc import Iterable
+from datetime import datetime
+from typing import NamedTuple, Optional
 
 from ..core.models import Task, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Statuses a task never leaves on its own; failures don't block these
+_SETTLED = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED})
+# Statuses that block a task's dependents
+_HOLDS_BACK = frozenset({TaskStatus.FAILED, TaskStatus.BLOCKED})
+
+
+def _ready_order(task: Task) -> tuple[int, datetime]:
+    """Sort key for ready tasks: priority, then creation order."""
+    return task.priority, task.created_at
+
 
 class DAGCycleError(Exception):
     """Raised when a cycle is detected in the task DAG."""
@@ -23,18 +38,49 @@ class DAGValidationError(Exception):
     pass
 
 
+class _CSRGraph(NamedTuple):
+    """Compressed sparse row snapshot of the dependency graph."""
+
+    # Task IDs by position; edges refer to tasks by this index
+    ids: list[str]
+    # Dependents of node u are indices[indptr[u]:indptr[u + 1]]
+    indptr: array
+    indices: array
+    # Number of incoming edges per node
+    in_degree: list[int]
+
+
 class TaskDAG:
     """
     Directed Acyclic Graph for task dependency management.
 
     Handles task ordering, dependency validation, and execution planning.
+
+    Readiness is tracked incrementally, so task status changes should go
+    through notify_status_change() rather than assigning ``task.status``.
     """
 
     def __init__(self) -> None:
         """Initialize the task DAG."""
         self.tasks: dict[str, Task] = {}
-        self._adjacency_list: dict[str, list[str]] = defaultdict(list)
-        self._reverse_adjacency: dict[str, list[str]] = defaultdict(list)
+        # Edges as insertion-ordered sets (dicts with None values): O(1) add and
+        # discard, deterministic iteration
+        self._adjacency_list: dict[str, dict[str, None]] = defaultdict(dict)
+        self._reverse_adjacency: dict[str, dict[str, None]] = defaultdict(dict)
+
+        # Per task, the number of dependency edges from tasks in the DAG
+        self._in_degree: dict[str, int] = {}
+        # Per task, the number of known dependencies not yet COMPLETED
+        self._remaining_deps: dict[str, int] = {}
+        # Candidate ready tasks as (priority, created_at, task_id). Entries are
+        # validated when they reach the top, so stale ones are simply skipped.
+        self._ready_heap: list[tuple[int, datetime, str]] = []
+        # Integer-indexed graph built by freeze(); dropped on any structural change
+        self._csr: Optional[_CSRGraph] = None
+
+        # Task counts per status, and tasks held back by a failed upstream task
+        self._status_counts: dict[TaskStatus, int] = dict.fromkeys(TaskStatus, 0)
+        self._blocked: set[str] = set()
 
     def add_task(self, task: Task) -> None:
         """
@@ -46,24 +92,300 @@ class TaskDAG:
         Raises:
             DAGValidationError: If adding task would create invalid state
         """
-        if task.id in self.tasks:
+        self._insert(task, check_cycle=True, incoming=frozenset())
+
+    def add_tasks(self, tasks: Iterable[Task]) -> None:
+        """
+        Add several tasks to the DAG, checking for cycles once.
+
+        Tasks may come in any order, including dependents before their
+        dependencies. Nothing is added if the tasks would create a cycle.
+
+        Args:
+            tasks: Tasks to add
+
+        Raises:
+            DAGCycleError: If adding the tasks would create a cycle
+        """
+        tasks = list(tasks)
+
+        # Dependencies of every task once the batch is in, later duplicates
+        # replacing earlier ones just as add_task would
+        dependencies = {task_id: t.dependencies for task_id, t in self.tasks.items()}
+        dependencies.update((task.id, task.dependencies) for task in tasks)
+        if self._has_cycle_in(dependencies):
+            raise DAGCycleError("Adding these tasks would create a cycle")
+
+        incoming = frozenset(dependencies)
+        for task in tasks:
+            self._insert(task, check_cycle=False, incoming=incoming)
+
+    def _insert(self, task: Task, check_cycle: bool, incoming: frozenset[str]) -> None:
+        """
+        Add or replace a task and update all incremental bookkeeping.
+
+        Args:
+            task: Task to add
+            check_cycle: Whether to check that the task closes no cycle
+            incoming: IDs about to be added, not worth a missing-dependency warning
+
+        Raises:
+            DAGCycleError: If check_cycle is set and the task closes a cycle
+        """
+        self._csr = None
+
+        # IDs key every internal dict; interned copies let lookups match by
+        # identity instead of comparing string contents
+        task.id = sys.intern(task.id)
+        task.dependencies[:] = map(sys.intern, task.dependencies)
+
+        previous = self.tasks.get(task.id)
+        if previous is not None:
             logger.warning(f"Task {task.id} already exists in DAG, replacing")
+            self._unlink_dependencies(previous)
 
         self.tasks[task.id] = task
 
         # Build adjacency lists
         for dep_id in task.dependencies:
-            if dep_id not in self.tasks:
+            if dep_id not in self.tasks and dep_id not in incoming:
                 logger.warning(f"Task {task.id} depends on unknown task {dep_id}")
-            self._adjacency_list[dep_id].append(task.id)
-            self._reverse_adjacency[task.id].append(dep_id)
-
-        # Validate no cycles
-        if self._has_cycle():
-            # Remove the task we just added
-            del self.tasks[task.id]
+            self._adjacency_list[dep_id][task.id] = None
+            self._reverse_adjacency[task.id][dep_id] = None
+
+        # Validate no cycles. The graph was acyclic before this insert, so any
+        # new cycle has to pass through the task just added.
+        if check_cycle and self._creates_cycle_from(task.id):
+            # Remove the task we just added, along with its edges
+            self._unlink_dependencies(task)
+            if previous is not None:
+                self.tasks[task.id] = previous
+                for dep_id in previous.dependencies:
+                    self._adjacency_list[dep_id][task.id] = None
+                    self._reverse_adjacency[task.id][dep_id] = None
+            else:
+                del self.tasks[task.id]
             raise DAGCycleError(f"Adding task {task.id} would create a cycle")
 
+        # A replaced failed or blocked task no longer holds its dependents
+        # back; the new task blocks them again below if it has to
+        if previous is not None and previous.status in _HOLDS_BACK:
+            self._unblock_downstream(task.id)
+
+        tasks = self.tasks
+        dep_ids = self._reverse_adjacency[task.id]  # Deduplicated dependencies
+        self._in_degree[task.id] = sum(1 for dep_id in dep_ids if dep_id in tasks)
+        if previous is None:
+            # Dependents added before this task now have one more known edge
+            in_degree = self._in_degree
+            for dependent_id in self._adjacency_list.get(task.id, ()):
+                if dependent_id in in_degree:
+                    in_degree[dependent_id] += 1
+
+        self._remaining_deps[task.id] = sum(
+            1
+            for dep_id in dep_ids
+            if dep_id in tasks and tasks[dep_id].status != TaskStatus.COMPLETED
+        )
+
+        was_completed = previous is None or previous.status == TaskStatus.COMPLETED
+        self._update_dependents(task.id, was_completed, task.status == TaskStatus.COMPLETED)
+        self._push_if_ready(task)
+
+        counts = self._status_counts
+        if previous is not None:
+            counts[TaskStatus(previous.status)] -= 1
+            self._blocked.discard(task.id)
+        counts[TaskStatus(task.status)] += 1
+        if task.status == TaskStatus.BLOCKED:
+            self._blocked.add(task.id)
+
+        # Tasks added under a failed or blocked dependency start out blocked
+        if task.status not in _SETTLED and any(
+            tasks[dep_id].status in _HOLDS_BACK
+            for dep_id in task.dependencies
+            if dep_id in tasks
+        ):
+            self._set_status(task, TaskStatus.BLOCKED)
+        if task.status in _HOLDS_BACK:
+            self._block_downstream([task.id])
+
+    def _unlink_dependencies(self, task: Task) -> None:
+        """Remove the edges from a task's dependencies to the task."""
+        for dep_id in self._reverse_adjacency.pop(task.id, ()):
+            dependents = self._adjacency_list.get(dep_id)
+            if dependents is not None:
+                dependents.pop(task.id, None)
+
+    def _update_dependents(self, task_id: str, was_completed: bool, is_completed: bool) -> None:
+        """
+        Adjust dependents' remaining-dependency counts after a status change.
+
+        Args:
+            task_id: Task whose status changed
+            was_completed: Whether the task previously counted as done
+            is_completed: Whether the task now counts as done
+        """
+        if was_completed == is_completed:
+            return
+
+        delta = -1 if is_completed else 1
+        remaining = self._remaining_deps
+        for dependent_id in self._adjacency_list.get(task_id, ()):
+            if dependent_id in remaining:
+                remaining[dependent_id] += delta
+                if remaining[dependent_id] == 0:
+                    self._push_if_ready(self.tasks[dependent_id])
+
+    def _push_if_ready(self, task: Task) -> None:
+        """Queue a task if it is PENDING with every dependency completed."""
+        if task.status == TaskStatus.PENDING and self._remaining_deps.get(task.id) == 0:
+            heapq.heappush(self._ready_heap, (task.priority, task.created_at, task.id))
+
+    def notify_status_change(self, task_id: str, new_status: TaskStatus) -> None:
+        """
+        Change a task's status and update readiness tracking.
+
+        A FAILED task blocks everything downstream of it that hasn't settled
+        yet. When a failed task is retried, those tasks are re-evaluated.
+
+        Args:
+            task_id: ID of the task
+            new_status: New status
+
+        Raises:
+            KeyError: If the task is not in the DAG
+        """
+        task = self.tasks[task_id]
+        old_status = task.status
+        self._set_status(task, new_status)
+
+        if new_status == TaskStatus.FAILED:
+            self._block_downstream([task_id])
+        elif old_status == TaskStatus.FAILED:
+            self._unblock_downstream(task_id)
+
+    def _set_status(self, task: Task, new_status: TaskStatus) -> None:
+        """Assign a status and update counters, readiness and the blocked set."""
+        old_status = task.status
+        task.status = new_status
+
+        counts = self._status_counts
+        counts[TaskStatus(old_status)] -= 1
+        counts[TaskStatus(new_status)] += 1
+
+        if new_status == TaskStatus.BLOCKED:
+            self._blocked.add(task.id)
+        else:
+            self._blocked.discard(task.id)
+
+        self._update_dependents(
+            task.id,
+            old_status == TaskStatus.COMPLETED,
+            new_status == TaskStatus.COMPLETED,
+        )
+        self._push_if_ready(task)
+
+    def _block_downstream(self, start_ids: list[str]) -> None:
+        """
+        Mark unsettled tasks downstream of the given tasks as BLOCKED.
+
+        Args:
+            start_ids: Failed or blocked tasks to propagate from
+        """
+        tasks = self.tasks
+        adjacency = self._adjacency_list
+        queue = deque(start_ids)
+
+        while queue:
+            for dependent_id in adjacency.get(queue.popleft(), ()):
+                dependent = tasks.get(dependent_id)
+                if dependent is None or dependent.status in _SETTLED:
+                    continue
+                if dependent.status != TaskStatus.BLOCKED:
+                    self._set_status(dependent, TaskStatus.BLOCKED)
+                    queue.append(dependent_id)
+
+    def _unblock_downstream(self, task_id: str) -> None:
+        """
+        Re-evaluate tasks that a no-longer-failed task had blocked.
+
+        Args:
+            task_id: Task that left the FAILED state
+        """
+        tasks = self.tasks
+        adjacency = self._adjacency_list
+        queue = deque([task_id])
+
+        # Release everything that was blocked below this task
+        while queue:
+            for dependent_id in adjacency.get(queue.popleft(), ()):
+                if dependent_id in self._blocked:
+                    self._set_status(tasks[dependent_id], TaskStatus.PENDING)
+                    queue.append(dependent_id)
+
+        # Then block again whatever another failure still holds back. Tasks
+        # still blocked count as sources too: a released task can sit below
+        # one, and the walk doesn't pass through already-blocked tasks.
+        holding = [t.id for t in tasks.values() if t.status in _HOLDS_BACK]
+        self._block_downstream(holding)
+
+    def _creates_cycle_from(self, task_id: str) -> bool:
+        """
+        Check whether a task can reach itself through its dependents.
+
+        Args:
+            task_id: Task to start from
+
+        Returns:
+            True if a path leads back to the task
+        """
+        adjacency = self._adjacency_list
+        visited = {task_id}
+        stack = list(adjacency.get(task_id, ()))
+
+        while stack:
+            node = stack.pop()
+            if node == task_id:
+                return True
+            if node not in visited:
+                visited.add(node)
+                stack.extend(adjacency.get(node, ()))
+
+        return False
+
+    @staticmethod
+    def _has_cycle_in(dependencies: dict[str, list[str]]) -> bool:
+        """
+        Check a task-to-dependencies mapping for a cycle with Kahn's algorithm.
+
+        Dependencies missing from the mapping are ignored, as in the DAG.
+
+        Args:
+            dependencies: Dependency IDs per task ID
+
+        Returns:
+            True if the dependencies contain a cycle
+        """
+        dependents: dict[str, list[str]] = defaultdict(list)
+        in_degree = dict.fromkeys(dependencies, 0)
+        for task_id, dep_ids in dependencies.items():
+            for dep_id in set(dep_ids):
+                if dep_id in in_degree:
+                    dependents[dep_id].append(task_id)
+                    in_degree[task_id] += 1
+
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        visited = 0
+        while queue:
+            visited += 1
+            for dependent_id in dependents.get(queue.popleft(), ()):
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+
+        return visited != len(in_degree)
+
     def remove_task(self, task_id: str) -> None:
         """
         Remove a task from the DAG.
@@ -75,23 +397,32 @@ class TaskDAG:
             logger.warning(f"Task {task_id} not found in DAG")
             return
 
+        self._csr = None
         task = self.tasks[task_id]
 
-        # Remove from adjacency lists
-        for dep_id in task.dependencies:
-            if task_id in self._adjacency_list[dep_id]:
-                self._adjacency_list[dep_id].remove(task_id)
+        # A removed dependency no longer holds up its dependents
+        self._update_dependents(task_id, task.status == TaskStatus.COMPLETED, True)
+        del self._remaining_deps[task_id]
 
-        # Remove reverse adjacency
-        for dependent_id in self._adjacency_list[task_id]:
-            if task_id in self._reverse_adjacency[dependent_id]:
-                self._reverse_adjacency[dependent_id].remove(task_id)
+        in_degree = self._in_degree
+        for dependent_id in self._adjacency_list.get(task_id, ()):
+            if dependent_id in in_degree:
+                in_degree[dependent_id] -= 1
+        del in_degree[task_id]
+
+        self._status_counts[TaskStatus(task.status)] -= 1
+        self._blocked.discard(task_id)
+
+        # Remove edges from dependencies. Edges to dependents stay, like edges
+        # to a dependency that hasn't been added yet, so re-adding the task
+        # links its dependents back up.
+        self._unlink_dependencies(task)
 
         del self.tasks[task_id]
-        if task_id in self._adjacency_list:
-            del self._adjacency_list[task_id]
-        if task_id in self._reverse_adjacency:
-            del self._reverse_adjacency[task_id]
+
+        # Dependents blocked by (or through) this task are free again
+        if task.status in _HOLDS_BACK:
+            self._unblock_downstream(task_id)
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
@@ -101,7 +432,7 @@ class TaskDAG:
         """Get all tasks in the DAG."""
         return list(self.tasks.values())
 
-    def get_ready_tasks(self) -> list[Task]:
+    def get_ready_tasks(self, limit: Optional[int] = None) -> list[Task]:
         """
         Get tasks that are ready to execute.
 
@@ -110,27 +441,39 @@ class TaskDAG:
         - All dependencies are COMPLETED
         - Task is not blocked
 
+        Args:
+            limit: Return at most this many tasks (e.g. one per free worker)
+
         Returns:
             List of ready tasks, sorted by priority
         """
         ready: list[Task] = []
+        tasks = self.tasks
+        pending = TaskStatus.PENDING
+        completed = TaskStatus.COMPLETED
 
-        for task in self.tasks.values():
-            if task.status != TaskStatus.PENDING:
+        for task in tasks.values():
+            if task.status != pending:
                 continue
 
-            # Check if all dependencies are completed
-            deps_completed = all(
-                self.tasks[dep_id].status == TaskStatus.COMPLETED
-                for dep_id in task.dependencies
-                if dep_id in self.tasks
-            )
+            deps = task.dependencies
+            if not deps:
+                ready.append(task)
+                continue
 
-            if deps_completed:
+            # Check if all dependencies are completed
+            for dep_id in deps:
+                dep = tasks.get(dep_id)
+                if dep is not None and dep.status != completed:
+                    break
+            else:
                 ready.append(task)
 
         # Sort by priority (lower number = higher priority)
-        ready.sort(key=lambda t: (t.priority, t.created_at))
+        if limit is not None and limit < len(ready):
+            # Partial selection; only the top `limit` candidates get ordered
+            return heapq.nsmallest(limit, ready, key=_ready_order)
+        ready.sort(key=_ready_order)
         return ready
 
     def get_next_task(self) -> Optional[Task]:
@@ -140,36 +483,66 @@ class TaskDAG:
         Returns:
             Highest priority ready task, or None if no tasks are ready
         """
-        ready_tasks = self.get_ready_tasks()
-        return ready_tasks[0] if ready_tasks else None
+        heap = self._ready_heap
+
+        while heap:
+            priority, created_at, task_id = heap[0]
+            task = self.tasks.get(task_id)
+
+            if (
+                task is not None
+                and task.status == TaskStatus.PENDING
+                and self._remaining_deps.get(task_id) == 0
+            ):
+                if task.priority == priority and task.created_at == created_at:
+                    return task
+                # Priority changed, or the task was replaced, since it was
+                # queued; requeue it under its current sort key
+                heapq.heapreplace(heap, (task.priority, task.created_at, task_id))
+                continue
+
+            heapq.heappop(heap)
+
+        return None
 
     def get_blocked_tasks(self) -> list[Task]:
         """
         Get tasks that are blocked.
 
-        A task is blocked if it has dependencies that are FAILED.
+        A task is blocked if a dependency, direct or transitive, is FAILED.
 
         Returns:
             List of blocked tasks
         """
-        blocked: list[Task] = []
+        return [self.tasks[task_id] for task_id in self._blocked]
 
-        for task in self.tasks.values():
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED]:
-                continue
+    def freeze(self) -> None:
+        """
+        Build a compact integer-indexed copy of the graph for fast traversal.
 
-            # Check if any dependency is failed
-            has_failed_dep = any(
-                self.tasks[dep_id].status == TaskStatus.FAILED
-                for dep_id in task.dependencies
-                if dep_id in self.tasks
-            )
+        Call once construction is finished. topological_sort(), and so the
+        cycle check in validate(), then walk flat int arrays instead of
+        per-node string lists.
+        Adding or removing a task discards the snapshot again; status
+        changes do not.
+        """
+        ids = list(self.tasks)
+        iloc = {task_id: i for i, task_id in enumerate(ids)}
+        adjacency = self._adjacency_list
 
-            if has_failed_dep:
-                task.status = TaskStatus.BLOCKED
-                blocked.append(task)
+        indptr = array("i", [0])
+        indices = array("i")
+        in_degree = [0] * len(ids)
 
-        return blocked
+        for task_id in ids:
+            for dependent_id in adjacency.get(task_id, ()):
+                v = iloc.get(dependent_id)
+                if v is not None:
+                    indices.append(v)
+                    in_degree[v] += 1
+            indptr.append(len(indices))
+
+        self._csr = _CSRGraph(ids, indptr, indices, in_degree)
 
     def topological_sort(self) -> list[Task]:
         """
@@ -181,24 +554,24 @@ class TaskDAG:
         Raises:
             DAGCycleError: If DAG contains a cycle
         """
-        # Kahn's algorithm
-        in_degree = {task_id: len(deps) for task_id, deps in self._reverse_adjacency.items()}
+        if self._csr is not None:
+            return self._topological_sort_csr(self._csr)
 
-        # Add tasks with no dependencies
-        for task_id in self.tasks:
-            if task_id not in in_degree:
-                in_degree[task_id] = 0
+        # Kahn's algorithm, starting from the maintained in-degrees
+        in_degree = self._in_degree.copy()
+        adjacency = self._adjacency_list
+        tasks = self.tasks
 
         # Queue of tasks with no dependencies
-        queue = deque([task_id for task_id, degree in in_degree.items() if degree == 0])
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
         result: list[Task] = []
 
         while queue:
             task_id = queue.popleft()
-            result.append(self.tasks[task_id])
+            result.append(tasks[task_id])
 
             # Reduce in-degree for dependent tasks
-            for dependent_id in self._adjacency_list[task_id]:
+            for dependent_id in adjacency.get(task_id, ()):
                 in_degree[dependent_id] -= 1
                 if in_degree[dependent_id] == 0:
                     queue.append(dependent_id)
@@ -208,36 +581,28 @@ class TaskDAG:
 
         return result
 
-    def _has_cycle(self) -> bool:
-        """
-        Check if the DAG contains a cycle using DFS.
+    def _topological_sort_csr(self, csr: _CSRGraph) -> list[Task]:
+        """Kahn's algorithm over a frozen CSR graph."""
+        tasks = self.tasks
+        ids, indptr, indices = csr.ids, csr.indptr, csr.indices
+        in_degree = csr.in_degree.copy()
 
-        Returns:
-            True if cycle detected
-        """
-        visited = set()
-        rec_stack = set()
-
-        def dfs(task_id: str) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
+        queue = deque(u for u, degree in enumerate(in_degree) if degree == 0)
+        result: list[Task] = []
 
-            for dependent_id in self._adjacency_list[task_id]:
-                if dependent_id not in visited:
-                    if dfs(dependent_id):
-                        return True
-                elif dependent_id in rec_stack:
-                    return True
+        while queue:
+            u = queue.popleft()
+            result.append(tasks[ids[u]])
 
-            rec_stack.remove(task_id)
-            return False
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
 
-        for task_id in self.tasks:
-            if task_id not in visited:
-                if dfs(task_id):
-                    return True
+        if len(result) != len(ids):
+            raise DAGCycleError("DAG contains a cycle")
 
-        return False
+        return result
 
     def get_task_dependencies(self, task_id: str) -> list[Task]:
         """Get all direct dependencies of a task."""
@@ -249,7 +614,7 @@ class TaskDAG:
 
     def get_task_dependents(self, task_id: str) -> list[Task]:
         """Get all tasks that depend on this task."""
-        dependent_ids = self._adjacency_list[task_id]
+        dependent_ids = self._adjacency_list.get(task_id, ())
         return [self.tasks[dep_id] for dep_id in dependent_ids if dep_id in self.tasks]
 
     def get_progress(self) -> dict[str, int]:
@@ -259,25 +624,17 @@ class TaskDAG:
         Returns:
             Dictionary with task counts by status
         """
-        stats = {
-            "total": len(self.tasks),
-            "pending": 0,
-            "running": 0,
-            "completed": 0,
-            "failed": 0,
-            "blocked": 0,
-            "skipped": 0,
-        }
-
-        for task in self.tasks.values():
-            stats[task.status.value] += 1
-
+        stats = {"total": len(self.tasks)}
+        stats.update((status.value, count) for status, count in self._status_counts.items())
         return stats
 
     def is_complete(self) -> bool:
         """Check if all tasks are completed or terminal state."""
-        terminal_states = {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.SKIPPED}
-        return all(task.status in terminal_states for task in self.tasks.values())
+        counts = self._status_counts
+        settled = (
+            counts[TaskStatus.COMPLETED] + counts[TaskStatus.FAILED] + counts[TaskStatus.SKIPPED]
+        )
+        return settled == len(self.tasks)
 
     def validate(self) -> list[str]:
         """
@@ -288,24 +645,20 @@ class TaskDAG:
         """
         errors: list[str] = []
 
-        # Check for cycles
-        if self._has_cycle():
+        # Check for cycles; the sort visits every task, so a short result
+        # can only mean a cycle and needs no separate reachability check
+        try:
+            self.topological_sort()
+        except DAGCycleError:
             errors.append("DAG contains a cycle")
 
         # Check for missing dependencies
-        for task in self.tasks.values():
+        tasks = self.tasks
+        for task in tasks.values():
             for dep_id in task.dependencies:
-                if dep_id not in self.tasks:
+                if dep_id not in tasks:
                     errors.append(f"Task {task.id} depends on non-existent task {dep_id}")
 
-        # Check for unreachable tasks (no path from any root)
-        try:
-            sorted_tasks = self.topological_sort()
-            if len(sorted_tasks) != len(self.tasks):
-                errors.append("Some tasks are unreachable")
-        except DAGCycleError:
-            pass  # Already caught above
-
         return errors
 
     def __len__(self) -> int:
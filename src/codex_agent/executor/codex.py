@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
-from datetime import datetime
+import re
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from openai import AsyncOpenAI, OpenAIError
 
@@ -17,6 +19,49 @@ from ..core.models import LLMRequest, LLMResponse, Task
 
 logger = logging.getLogger(__name__)
 
+# Fenced code block: optional language tag, then everything up to the closing
+# fence. Same matches as the lazy r"```(\w+)?\n(.*?)```" with DOTALL, but the
+# body consumes whole runs of non-backtick characters instead of testing for
+# the closing fence after every character.
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n([^`]*(?:`(?!``)[^`]*)*)```")
+
+
+class _CodeBlockStream:
+    """
+    Incremental code block extractor for streamed responses.
+
+    A block is emitted as soon as its closing fence arrives. Matching resumes
+    where the last block ended, so the blocks are the same ones
+    extract_code_blocks finds in the complete text.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._buffer = ""
+        self._pos = 0
+
+    def feed(self, text: str) -> list[dict[str, str]]:
+        """
+        Add streamed text and return blocks completed by it.
+
+        Args:
+            text: Next chunk of the response
+
+        Returns:
+            Newly completed code blocks with language and code
+        """
+        self._buffer += text
+        if "`" not in text:
+            # Only a backtick can complete a closing fence
+            return []
+
+        blocks = []
+        for match in _CODE_BLOCK_RE.finditer(self._buffer, self._pos):
+            language, code = match.groups()
+            blocks.append({"language": language or "text", "code": code.strip()})
+            self._pos = match.end()
+        return blocks
+
 
 class CodexExecutorError(Exception):
     """Base exception for Codex executor errors."""
@@ -32,6 +77,16 @@ class CodexExecutor:
     and caching.
     """
 
+    CACHE_DB_NAME = "llm_cache.db"
+
+    CACHE_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS llm_cache (
+        key TEXT PRIMARY KEY,
+        content TEXT NOT NULL,
+        cached_at REAL NOT NULL
+    );
+    """
+
     def __init__(self, config: Config) -> None:
         """
         Initialize the Codex executor.
@@ -43,6 +98,31 @@ class CodexExecutor:
         self.client = AsyncOpenAI(api_key=config.llm.api_key)
         self.cache_dir = config.cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_db = self._open_cache_db(self.cache_dir / self.CACHE_DB_NAME)
+        # Cache I/O runs in worker threads; the connection is shared, so serialize it
+        self._cache_lock = threading.Lock()
+        # LLM calls in progress, by cache key, so identical prompts share one call
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+    @classmethod
+    def _open_cache_db(cls, db_path: Path) -> sqlite3.Connection:
+        """
+        Open the response cache database.
+
+        One connection is kept for the executor's lifetime, in WAL mode, so
+        lookups cost a single indexed SELECT rather than a file open.
+
+        Args:
+            db_path: Path to the SQLite file
+
+        Returns:
+            Open connection
+        """
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(cls.CACHE_SCHEMA_SQL)
+        return conn
 
     async def execute_task(
         self, task: Task, context: dict[str, Any]
@@ -65,29 +145,164 @@ class CodexExecutor:
 
         # Check cache
         cache_key = self._get_cache_key(prompt, self.config.llm.model)
-        cached_response = self._get_from_cache(cache_key)
+        cached_response = await self._get_from_cache(cache_key)
 
         if cached_response:
             logger.info(f"Cache hit for task {task.id}")
-            # Build a dummy request for the cached response
-            request = LLMRequest(
-                task_id=task.id,
-                model=self.config.llm.model,
-                temperature=self.config.llm.temperature,
-                max_tokens=self.config.llm.max_tokens_per_request,
-            )
-            return cached_response, request, LLMResponse(
-                request_id=request.id, content=cached_response, finish_reason="cached", cached=True
-            )
+            return self._reused_response(task, cached_response, "cached")
+
+        # Join an identical request that is already waiting on the LLM. If the
+        # caller that made it is cancelled, the first waiter to resume makes
+        # the call itself and the others join that one.
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            logger.info(f"Joining in-flight LLM request for task {task.id}")
+            try:
+                content = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                if not inflight.cancelled() or (current is not None and current.cancelling()):
+                    raise
+                continue
+            return self._reused_response(task, content, "coalesced")
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
 
-        # Make LLM call
-        request, response = await self._call_llm(task, prompt)
-
-        # Cache the response
-        self._save_to_cache(cache_key, response.content)
+        try:
+            # Make LLM call
+            request, response = await self._call_llm(task, prompt)
+
+            # Cache the response before waiters are released and the entry is dropped
+            await self._save_to_cache(cache_key, response.content)
+            future.set_result(response.content)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't log "exception was never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self._inflight[cache_key]
 
         return response.content, request, response
 
+    async def execute_tasks(
+        self, tasks: list[Task], context: dict[str, Any]
+    ) -> list[tuple[str, LLMRequest, LLMResponse]]:
+        """
+        Execute several tasks concurrently.
+
+        At most ``llm.max_concurrent_requests`` calls are outstanding at once,
+        so throughput is bounded by the provider rather than by sequential round
+        trips. Tasks with identical prompts share one call.
+
+        Args:
+            tasks: Tasks to execute
+            context: Execution context shared by all tasks
+
+        Returns:
+            One (generated_code, request, response) tuple per task, in order
+
+        Raises:
+            CodexExecutorError: If any execution fails; the remaining calls
+                are cancelled rather than left running
+        """
+        semaphore = asyncio.Semaphore(self.config.llm.max_concurrent_requests)
+
+        async def run(task: Task) -> tuple[str, LLMRequest, LLMResponse]:
+            async with semaphore:
+                return await self.execute_task(task, context)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                runs = [group.create_task(run(task)) for task in tasks]
+        except ExceptionGroup as e:
+            # Surface the failure itself, as a single call would
+            raise e.exceptions[0] from e
+
+        return [run_task.result() for run_task in runs]
+
+    async def stream_task(self, task: Task, context: dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Execute a task, yielding response text as it is generated.
+
+        A cached response is yielded as a single chunk. A streamed response is
+        cached once it completes.
+
+        Args:
+            task: Task to execute
+            context: Execution context (file contents, related code, etc.)
+
+        Yields:
+            Chunks of response content
+
+        Raises:
+            CodexExecutorError: If execution fails
+        """
+        prompt = self._build_prompt(task, context)
+        cache_key = self._get_cache_key(prompt, self.config.llm.model)
+        cached_response = await self._get_from_cache(cache_key)
+
+        if cached_response:
+            logger.info(f"Cache hit for task {task.id}")
+            yield cached_response
+            return
+
+        chunks: list[str] = []
+        async for chunk in self._stream_llm(task, prompt):
+            chunks.append(chunk)
+            yield chunk
+
+        await self._save_to_cache(cache_key, "".join(chunks))
+
+    async def stream_code_blocks(
+        self, task: Task, context: dict[str, Any]
+    ) -> AsyncIterator[dict[str, str]]:
+        """
+        Execute a task, yielding each code block as soon as it is closed.
+
+        Args:
+            task: Task to execute
+            context: Execution context (file contents, related code, etc.)
+
+        Yields:
+            Code blocks with language and code, in response order
+
+        Raises:
+            CodexExecutorError: If execution fails
+        """
+        scanner = _CodeBlockStream()
+        async for chunk in self.stream_task(task, context):
+            for block in scanner.feed(chunk):
+                yield block
+
+    def _reused_response(
+        self, task: Task, content: str, finish_reason: str
+    ) -> tuple[str, LLMRequest, LLMResponse]:
+        """
+        Build the result for content that didn't need its own LLM call.
+
+        Args:
+            task: Task being executed
+            content: Cached or shared response content
+            finish_reason: Why no call was made ("cached" or "coalesced")
+
+        Returns:
+            Tuple of (content, request, response)
+        """
+        # Build a dummy request for the reused response
+        request = LLMRequest(
+            task_id=task.id,
+            model=self.config.llm.model,
+            temperature=self.config.llm.temperature,
+            max_tokens=self.config.llm.max_tokens_per_request,
+        )
+        return content, request, LLMResponse(
+            request_id=request.id, content=content, finish_reason=finish_reason, cached=True
+        )
+
     def _build_prompt(self, task: Task, context: dict[str, Any]) -> str:
         """
         Build the prompt for the LLM.
@@ -125,19 +340,23 @@ Complexity: {task.estimated_complexity}/5
         # Target files context
         files_context = ""
         if task.target_files:
-            files_context = "\n## Target Files\n"
+            files = context.get("files", {})
+            parts = ["\n## Target Files\n"]
             for file_path in task.target_files:
-                file_content = context.get("files", {}).get(file_path, "")
+                file_content = files.get(file_path, "")
                 if file_content:
-                    files_context += f"\n### {file_path}\n```\n{file_content}\n```\n"
+                    parts.append(f"\n### {file_path}\n```\n{file_content}\n```\n")
+            files_context = "".join(parts)
 
         # Related code context
         related_context = ""
         related_files = context.get("related_files", {})
         if related_files:
-            related_context = "\n## Related Code\n"
-            for file_path, summary in related_files.items():
-                related_context += f"\n### {file_path}\n{summary}\n"
+            parts = ["\n## Related Code\n"]
+            parts.extend(
+                f"\n### {file_path}\n{summary}\n" for file_path, summary in related_files.items()
+            )
+            related_context = "".join(parts)
 
         # Error context for retries
         error_context = ""
@@ -189,7 +408,7 @@ Explain your approach and any important decisions.
             max_tokens=self.config.llm.max_tokens_per_request,
         )
 
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Call OpenAI API
@@ -211,7 +430,7 @@ Explain your approach and any important decisions.
                 request.completion_tokens = response.usage.completion_tokens
                 request.total_tokens = response.usage.total_tokens
 
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             request.duration_ms = duration_ms
             request.success = True
 
@@ -245,6 +464,47 @@ Explain your approach and any important decisions.
             logger.error(f"Unexpected error in LLM call for task {task.id}: {e}")
             raise CodexExecutorError(f"Unexpected error: {e}") from e
 
+    async def _stream_llm(self, task: Task, prompt: str) -> AsyncIterator[str]:
+        """
+        Make a streaming API call to the LLM.
+
+        Args:
+            task: Task being executed
+            prompt: Prompt to send
+
+        Yields:
+            Content deltas as they arrive
+
+        Raises:
+            CodexExecutorError: If API call fails
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.llm.model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=self.config.llm.temperature,
+                max_tokens=self.config.llm.max_tokens_per_request,
+                timeout=self.config.llm.timeout_seconds,
+                stream=True,
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except OpenAIError as e:
+            logger.error(f"LLM call failed for task {task.id}: {e}")
+            raise CodexExecutorError(f"LLM API error: {e}") from e
+
+        except Exception as e:
+            logger.error(f"Unexpected error in LLM call for task {task.id}: {e}")
+            raise CodexExecutorError(f"Unexpected error: {e}") from e
+
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        logger.info(f"LLM stream finished for task {task.id} in {duration_ms}ms")
+
     def _get_cache_key(self, prompt: str, model: str) -> str:
         """
         Generate a cache key for a prompt.
@@ -256,10 +516,21 @@ Explain your approach and any important decisions.
         Returns:
             Cache key (hash)
         """
-        content = f"{model}:{prompt}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # Same digest as hashing f"{model}:{prompt}", without building that copy
+        hasher = hashlib.sha256(model.encode())
+        hasher.update(b":")
+        hasher.update(prompt.encode())
+        return hasher.hexdigest()
+
+    async def _get_from_cache(self, cache_key: str) -> Optional[str]:
+        """Get a cached response without blocking the event loop."""
+        return await asyncio.to_thread(self._get_from_cache_sync, cache_key)
 
-    def _get_from_cache(self, cache_key: str) -> Optional[str]:
+    async def _save_to_cache(self, cache_key: str, content: str) -> None:
+        """Save a response to cache without blocking the event loop."""
+        await asyncio.to_thread(self._save_to_cache_sync, cache_key, content)
+
+    def _get_from_cache_sync(self, cache_key: str) -> Optional[str]:
         """
         Get a cached response.
 
@@ -269,20 +540,18 @@ Explain your approach and any important decisions.
         Returns:
             Cached content or None
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        if not cache_file.exists():
-            return None
-
         try:
-            with open(cache_file) as f:
-                data = json.load(f)
-                return data.get("content")
-        except Exception as e:
-            logger.warning(f"Failed to read cache file {cache_file}: {e}")
+            with self._cache_lock:
+                row = self._cache_db.execute(
+                    "SELECT content FROM llm_cache WHERE key = ?", (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read cache entry {cache_key}: {e}")
             return None
 
-    def _save_to_cache(self, cache_key: str, content: str) -> None:
+        return row[0] if row else None
+
+    def _save_to_cache_sync(self, cache_key: str, content: str) -> None:
         """
         Save a response to cache.
 
@@ -290,15 +559,19 @@ Explain your approach and any important decisions.
             cache_key: Cache key
             content: Content to cache
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
         try:
-            with open(cache_file, "w") as f:
-                json.dump(
-                    {"content": content, "cached_at": datetime.utcnow().isoformat()}, f, indent=2
+            with self._cache_lock, self._cache_db:
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, content, cached_at) VALUES (?, ?, ?)",
+                    (cache_key, content, time.time()),
                 )
-        except Exception as e:
-            logger.warning(f"Failed to write cache file {cache_file}: {e}")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write cache entry {cache_key}: {e}")
+
+    def close(self) -> None:
+        """Close the response cache database."""
+        with self._cache_lock:
+            self._cache_db.close()
 
     def extract_code_blocks(self, content: str) -> list[dict[str, str]]:
         """
@@ -310,17 +583,10 @@ Explain your approach and any important decisions.
         Returns:
             List of code blocks with language and code
         """
-        import re
-
-        # Pattern to match code blocks
-        pattern = r"```(\w+)?\n(.*?)```"
-        matches = re.findall(pattern, content, re.DOTALL)
-
-        code_blocks = []
-        for language, code in matches:
-            code_blocks.append({"language": language or "text", "code": code.strip()})
-
-        return code_blocks
+        return [
+            {"language": language or "text", "code": code.strip()}
+            for language, code in _CODE_BLOCK_RE.findall(content)
+        ]
 
     async def validate_response(self, response: str, task: Task) -> tuple[bool, Optional[str]]:
         """
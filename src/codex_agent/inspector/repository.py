@@ -2,16 +2,117 @@
 
 from __future__ import annotations
 
+import ast
+import fnmatch
+import functools
 import hashlib
+import heapq
 import logging
+import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+
+from pydantic import TypeAdapter, ValidationError
 
 from ..core.models import FileIndex, Symbol
 
 logger = logging.getLogger(__name__)
 
+_FILE_INDEX_LIST = TypeAdapter(list[FileIndex])
+
+# Line patterns for Python sources; matched against stripped lines
+_FUNC_RE = re.compile(r"def\s+(\w+)\s*\((.*?)\):")
+_CLASS_RE = re.compile(r"class\s+(\w+)")
+_IMPORT_RE = re.compile(r"(?:from\s+(\S+)\s+)?import\s+(.+)")
+
+
+@functools.lru_cache(maxsize=256)
+def _load_file(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Read a text file, memoized on its path and stat signature.
+
+    Tasks that share target files would otherwise re-read and re-decode the
+    same contents for every prompt. A changed mtime or size misses the cache,
+    so edits made between tasks are picked up.
+
+    Args:
+        path: Absolute file path
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        File contents
+    """
+    # One read of the whole file instead of buffered text-mode reads
+    text = Path(path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        # Same result as text mode's universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _intern_names(file_index: FileIndex) -> FileIndex:
+    """
+    Intern the identifier strings of an index entry, in place.
+
+    The same module and symbol names recur across thousands of files;
+    interning keeps one string object per distinct name, however the entry
+    was built (parsed here, unpickled from a worker, or loaded from disk).
+
+    Args:
+        file_index: Entry to update
+
+    Returns:
+        The same entry
+    """
+    file_index.language = sys.intern(file_index.language)
+    file_index.imports[:] = map(sys.intern, file_index.imports)
+    file_index.exports[:] = map(sys.intern, file_index.exports)
+    for symbol in file_index.symbols:
+        symbol.name = sys.intern(symbol.name)
+        symbol.type = sys.intern(symbol.type)
+    return file_index
+
+
+class _RelatedIndex(NamedTuple):
+    """Reverse lookups from a name to the files that have it, for find_related_files."""
+
+    exporters: dict[str, list[str]]
+    importers: dict[str, list[str]]
+    path_parts: dict[str, list[str]]
+    symbols: dict[str, list[str]]
+    position: dict[str, int]
+
+
+# Per-process inspector used by _index_file_in_worker
+_worker_inspector: Optional[RepositoryInspector] = None
+
+
+def _index_file_in_worker(root_path: Path, file_path: Path) -> tuple[Optional[FileIndex], str]:
+    """
+    Build one file's index entry in a pool worker.
+
+    Args:
+        root_path: Repository root
+        file_path: File to index
+
+    Returns:
+        Tuple of (index entry or None, error message or "")
+    """
+    global _worker_inspector
+    if _worker_inspector is None or _worker_inspector.root_path != root_path:
+        _worker_inspector = RepositoryInspector(root_path)
+
+    try:
+        return _worker_inspector._build_file_index(file_path), ""
+    except Exception as e:
+        return None, str(e)
+
 
 class RepositoryInspector:
     """
@@ -21,15 +122,25 @@ class RepositoryInspector:
     and context selection for LLM prompts.
     """
 
-    def __init__(self, root_path: Path) -> None:
+    def __init__(self, root_path: Path, index_path: Optional[Path] = None) -> None:
         """
         Initialize the repository inspector.
 
         Args:
             root_path: Root directory of the repository
+            index_path: File to persist the index in between runs, so
+                unchanged files aren't re-read (e.g. .codex/file_index.json)
         """
         self.root_path = root_path
+        self.index_path = index_path
         self.file_index: dict[str, FileIndex] = {}
+        # Lookup structures built on first use; reset whenever indexing runs
+        self._related_index: Optional[_RelatedIndex] = None
+        self._symbol_search_index: Optional[list[tuple[str, str, Symbol]]] = None
+        self._language_index: Optional[dict[str, list[str]]] = None
+        # Extraction results by (language, content hash); unchanged content,
+        # here or in a copy elsewhere in the tree, is only parsed once
+        self._parse_cache: dict[tuple[str, str], tuple[list[Symbol], list[str], list[str]]] = {}
         self._language_extensions = {
             "py": "python",
             "js": "javascript",
@@ -51,12 +162,24 @@ class RepositoryInspector:
             "sql": "sql",
         }
 
-    def index_repository(self, exclude_patterns: Optional[list[str]] = None) -> None:
+    # Below this many files, process startup costs more than it saves
+    PARALLEL_MIN_FILES = 256
+
+    def index_repository(
+        self,
+        exclude_patterns: Optional[list[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
         """
         Index all files in the repository.
 
+        Large repositories are indexed in a process pool, since reading,
+        hashing and parsing each file is independent work.
+
         Args:
             exclude_patterns: Patterns to exclude (e.g., ['*.pyc', '__pycache__'])
+            max_workers: Worker processes to use (defaults to the CPU count;
+                1 indexes in this process)
         """
         if exclude_patterns is None:
             exclude_patterns = [
@@ -73,158 +196,396 @@ class RepositoryInspector:
 
         logger.info(f"Indexing repository at {self.root_path}")
 
-        for file_path in self.root_path.rglob("*"):
-            # Skip directories
-            if file_path.is_dir():
-                continue
+        file_paths = self._walk_files(exclude_patterns)
+
+        # Reuse entries whose file is unchanged since it was last indexed
+        previous = self.file_index or self._load_index()
+        self.file_index = {}
+        self._invalidate_lookups()
+        stale_paths = []
+        for file_path in file_paths:
+            entry = previous.get(str(file_path.relative_to(self.root_path)))
+            if entry is not None and entry.mtime_ns is not None:
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                if entry.mtime_ns == stat.st_mtime_ns and entry.size_bytes == stat.st_size:
+                    self.file_index[entry.path] = entry
+                    continue
+            stale_paths.append(file_path)
+
+        reused = len(self.file_index)
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(stale_paths) >= self.PARALLEL_MIN_FILES:
+            self._index_files_parallel(stale_paths, workers)
+        else:
+            for file_path in stale_paths:
+                # Index the file
+                try:
+                    self._index_file(file_path)
+                except Exception as e:
+                    logger.warning(f"Failed to index {file_path}: {e}")
+
+        logger.info(
+            f"Indexed {len(self.file_index)} files "
+            f"({reused} unchanged)"
+        )
+        self._save_index()
 
-            # Skip excluded patterns
-            if self._should_exclude(file_path, exclude_patterns):
-                continue
+    def _load_index(self) -> dict[str, FileIndex]:
+        """Load the persisted index, or an empty one if there is none."""
+        if self.index_path is None:
+            return {}
 
-            # Index the file
+        try:
+            entries = _FILE_INDEX_LIST.validate_json(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable file index {self.index_path}: {e}")
+            return {}
+
+        return {entry.path: _intern_names(entry) for entry in entries}
+
+    def _save_index(self) -> None:
+        """Persist the index to index_path, if one is configured."""
+        if self.index_path is None:
+            return
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self.index_path.write_bytes(_FILE_INDEX_LIST.dump_json(list(self.file_index.values())))
+        except OSError as e:
+            logger.warning(f"Failed to save file index {self.index_path}: {e}")
+
+    def _index_files_parallel(self, file_paths: list[Path], workers: int) -> None:
+        """
+        Index files across a process pool, keeping walk order in the index.
+
+        Args:
+            file_paths: Files to index
+            workers: Number of worker processes
+        """
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        roots = [self.root_path] * len(file_paths)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_index_file_in_worker, roots, file_paths, chunksize=chunksize)
+            for file_path, (file_index, error) in zip(file_paths, results, strict=True):
+                if error:
+                    logger.warning(f"Failed to index {file_path}: {error}")
+                elif file_index is not None:
+                    self.file_index[file_index.path] = _intern_names(file_index)
+
+    def _walk_files(self, exclude_patterns: list[str]) -> list[Path]:
+        """
+        List files under the root, pruning excluded directories before descent.
+
+        Patterns without a slash are matched against each entry's name, so an
+        excluded directory such as node_modules is never listed. Patterns with
+        a slash are matched against the path relative to the root.
+
+        Args:
+            exclude_patterns: Glob patterns to exclude
+
+        Returns:
+            Paths of files to index
+        """
+        # One compiled alternation for all name patterns, same matching as fnmatch
+        name_patterns = [pattern for pattern in exclude_patterns if "/" not in pattern]
+        name_match = (
+            re.compile(
+                "|".join(fnmatch.translate(os.path.normcase(p)) for p in name_patterns)
+            ).match
+            if name_patterns
+            else None
+        )
+        path_patterns = [pattern for pattern in exclude_patterns if "/" in pattern]
+        root = str(self.root_path)
+        files: list[Path] = []
+        pending = [root]
+
+        while pending:
+            directory = pending.pop()
             try:
-                self._index_file(file_path)
-            except Exception as e:
-                logger.warning(f"Failed to index {file_path}: {e}")
-
-        logger.info(f"Indexed {len(self.file_index)} files")
-
-    def _should_exclude(self, file_path: Path, exclude_patterns: list[str]) -> bool:
-        """Check if a file should be excluded."""
-        for pattern in exclude_patterns:
-            if file_path.match(pattern):
-                return True
-            # Check if any parent matches the pattern
-            for parent in file_path.parents:
-                if parent.match(pattern):
-                    return True
-        return False
+                entries = os.scandir(directory)
+            except OSError as e:
+                logger.warning(f"Failed to list {directory}: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    if name_match is not None and name_match(os.path.normcase(entry.name)):
+                        continue
+                    if path_patterns:
+                        relative = Path(os.path.relpath(entry.path, root))
+                        if any(relative.match(pattern) for pattern in path_patterns):
+                            continue
+
+                    if entry.is_dir():
+                        # Like rglob, don't follow symlinked directories
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        files.append(Path(entry.path))
+
+        return files
 
     def _index_file(self, file_path: Path) -> None:
         """Index a single file."""
+        file_index = self._build_file_index(file_path)
+        if file_index is not None:
+            self.file_index[file_index.path] = _intern_names(file_index)
+            self._invalidate_lookups()
+
+    def _invalidate_lookups(self) -> None:
+        """Drop lookup structures derived from file_index."""
+        self._related_index = None
+        self._symbol_search_index = None
+        self._language_index = None
+
+    def _build_file_index(self, file_path: Path) -> Optional[FileIndex]:
+        """Build the index entry for a file, or None for binary files."""
         relative_path = str(file_path.relative_to(self.root_path))
 
         # Determine language
         language = self._detect_language(file_path)
 
-        # Read file content
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Skip binary files
-            logger.debug(f"Skipping binary file: {relative_path}")
-            return
+        # Stat before reading, so a write that lands mid-read leaves the entry stale
+        stat = file_path.stat()
 
-        # Calculate hash
-        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        # Read file content; hash the bytes as read rather than re-encoding
+        data = file_path.read_bytes()
+        content_hash = hashlib.sha256(data).hexdigest()
 
-        # Extract symbols
-        symbols = self._extract_symbols(content, language)
+        parsed = self._parse_cache.get((language, content_hash))
+        if parsed is None:
+            try:
+                content = data.decode("utf-8")
+            except UnicodeDecodeError:
+                # Skip binary files
+                logger.debug("Skipping binary file: %s", relative_path)
+                return None
+
+            # Extract symbols and imports/exports
+            parsed = self._parse_cache[(language, content_hash)] = self._extract_source(
+                content, language
+            )
 
-        # Extract imports/exports
-        imports, exports = self._extract_imports_exports(content, language)
+        symbols, imports, exports = parsed
 
         # Create index entry
-        file_index = FileIndex(
+        return FileIndex(
             path=relative_path,
             language=language,
-            size_bytes=file_path.stat().st_size,
+            size_bytes=stat.st_size,
             hash=content_hash,
             symbols=symbols,
             imports=imports,
             exports=exports,
-            last_modified=datetime.fromtimestamp(file_path.stat().st_mtime),
+            last_modified=datetime.fromtimestamp(stat.st_mtime),
+            mtime_ns=stat.st_mtime_ns,
         )
 
-        self.file_index[relative_path] = file_index
-
     def _detect_language(self, file_path: Path) -> str:
         """Detect programming language from file extension."""
         suffix = file_path.suffix.lstrip(".")
         return self._language_extensions.get(suffix, "text")
 
-    def _extract_symbols(self, content: str, language: str) -> list[Symbol]:
+    def _extract_source(
+        self, content: str, language: str
+    ) -> tuple[list[Symbol], list[str], list[str]]:
         """
-        Extract symbols (functions, classes) from code.
+        Extract symbols, imports and exports from a file in one pass.
 
-        This is a simple implementation. For production, consider using
-        tree-sitter or language-specific parsers.
-        """
-        symbols: list[Symbol] = []
+        Python is parsed once with the ast module and symbols, imports and
+        ``__all__`` exports are all read from that tree. Files that don't
+        parse fall back to line-by-line regex matching.
 
-        # Simple regex-based extraction for Python
-        if language == "python":
-            import re
-
-            # Find function definitions
-            func_pattern = r"^def\s+(\w+)\s*\((.*?)\):"
-            for i, line in enumerate(content.split("\n"), 1):
-                match = re.match(func_pattern, line.strip())
-                if match:
-                    symbols.append(
-                        Symbol(
-                            name=match.group(1),
-                            type="function",
-                            line_start=i,
-                            line_end=i,  # TODO: Find actual end
-                            signature=f"def {match.group(1)}({match.group(2)})",
-                        )
-                    )
+        Args:
+            content: File content
+            language: Detected language
 
-            # Find class definitions
-            class_pattern = r"^class\s+(\w+)"
-            for i, line in enumerate(content.split("\n"), 1):
-                match = re.match(class_pattern, line.strip())
-                if match:
-                    symbols.append(
-                        Symbol(
-                            name=match.group(1),
-                            type="class",
-                            line_start=i,
-                            line_end=i,  # TODO: Find actual end
-                        )
-                    )
+        Returns:
+            Tuple of (symbols, imports, exports)
+        """
+        if language == "python":
+            try:
+                tree = ast.parse(content)
+            except (SyntaxError, ValueError):
+                imports, exports = self._extract_imports_regex(content)
+                return self._extract_symbols_regex(content), imports, exports
+            return (
+                self._extract_python_symbols(tree),
+                self._extract_python_imports(tree),
+                self._extract_python_exports(tree),
+            )
 
         # TODO: Add support for other languages
 
-        return symbols
+        return [], [], []
+
+    def _extract_symbols(self, content: str, language: str) -> list[Symbol]:
+        """Extract symbols (functions, classes) from code."""
+        return self._extract_source(content, language)[0]
 
     def _extract_imports_exports(self, content: str, language: str) -> tuple[list[str], list[str]]:
         """Extract import and export statements."""
+        _, imports, exports = self._extract_source(content, language)
+        return imports, exports
+
+    @staticmethod
+    def _extract_python_imports(tree: ast.AST) -> list[str]:
+        """
+        Collect imported module and member names in source order.
+
+        ``from pkg import a, b`` yields pkg, a and b (relative modules keep
+        their leading dots); ``import a.b as c`` yields a.b.
+        """
+        statements = [
+            node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))
+        ]
+        statements.sort(key=lambda node: (node.lineno, node.col_offset))
+
         imports: list[str] = []
+        for node in statements:
+            if isinstance(node, ast.ImportFrom):
+                imports.append("." * node.level + (node.module or ""))
+            imports.extend(alias.name for alias in node.names)
+        return imports
+
+    @staticmethod
+    def _extract_python_exports(tree: ast.Module) -> list[str]:
+        """
+        Collect the names listed in a module's top-level ``__all__``.
+
+        Handles ``__all__ = [...]`` (plain or annotated) and ``__all__ += [...]``
+        with list or tuple literals of strings; other assignments are skipped.
+        """
         exports: list[str] = []
 
-        if language == "python":
-            import re
-
-            # Find imports
-            import_pattern = r"^(?:from\s+(\S+)\s+)?import\s+(.+)"
-            for line in content.split("\n"):
-                match = re.match(import_pattern, line.strip())
-                if match:
-                    if match.group(1):
-                        imports.append(match.group(1))
-                    imports.extend(
-                        item.strip().split()[0] for item in match.group(2).split(",")
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                targets, value = node.targets, node.value
+            elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+                if node.value is None:
+                    continue
+                if isinstance(node, ast.AugAssign) and not isinstance(node.op, ast.Add):
+                    continue
+                targets, value = [node.target], node.value
+            else:
+                continue
+
+            if not any(isinstance(t, ast.Name) and t.id == "__all__" for t in targets):
+                continue
+            if not isinstance(value, (ast.List, ast.Tuple)):
+                continue
+
+            names = [
+                elt.value
+                for elt in value.elts
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            ]
+            if isinstance(node, ast.AugAssign):
+                exports.extend(names)
+            else:
+                exports[:] = names
+
+        return exports
+
+    @staticmethod
+    def _extract_python_symbols(tree: ast.AST) -> list[Symbol]:
+        """Collect function and class definitions, at any nesting depth, in line order."""
+        symbols: list[Symbol] = []
+
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+                symbols.append(
+                    Symbol(
+                        name=node.name,
+                        type="function",
+                        line_start=node.lineno,
+                        line_end=node.end_lineno or node.lineno,
+                        signature=f"{prefix} {node.name}({ast.unparse(node.args)})",
+                    )
+                )
+            elif isinstance(node, ast.ClassDef):
+                symbols.append(
+                    Symbol(
+                        name=node.name,
+                        type="class",
+                        line_start=node.lineno,
+                        line_end=node.end_lineno or node.lineno,
                     )
+                )
 
-        # TODO: Add support for other languages
+        symbols.sort(key=lambda symbol: symbol.line_start)
+        return symbols
+
+    def _extract_symbols_regex(self, content: str) -> list[Symbol]:
+        """Extract Python symbols with per-line regexes, for files ast can't parse."""
+        symbols: list[Symbol] = []
+        lines = content.split("\n")
+
+        # Find function definitions
+        for i, line in enumerate(lines, 1):
+            match = _FUNC_RE.match(line.strip())
+            if match:
+                symbols.append(
+                    Symbol(
+                        name=match.group(1),
+                        type="function",
+                        line_start=i,
+                        line_end=i,
+                        signature=f"def {match.group(1)}({match.group(2)})",
+                    )
+                )
+
+        # Find class definitions
+        for i, line in enumerate(lines, 1):
+            match = _CLASS_RE.match(line.strip())
+            if match:
+                symbols.append(
+                    Symbol(
+                        name=match.group(1),
+                        type="class",
+                        line_start=i,
+                        line_end=i,
+                    )
+                )
+
+        return symbols
+
+    def _extract_imports_regex(self, content: str) -> tuple[list[str], list[str]]:
+        """Extract Python imports with a per-line regex, for files ast can't parse."""
+        imports: list[str] = []
+        exports: list[str] = []
+
+        # Find imports
+        for line in content.split("\n"):
+            match = _IMPORT_RE.match(line.strip())
+            if match:
+                if match.group(1):
+                    imports.append(match.group(1))
+                imports.extend(item.strip().split()[0] for item in match.group(2).split(","))
 
         return imports, exports
 
     def get_file_content(self, file_path: str) -> Optional[str]:
         """Get the content of a file."""
-        full_path = self.root_path / file_path
+        # abspath, unlike resolve(), costs no syscalls
+        full_path = os.path.abspath(self.root_path / file_path)
 
-        if not full_path.exists():
+        # EAFP: a file removed between the stat and the read is still "not found"
+        try:
+            stat = os.stat(full_path)
+            return _load_file(full_path, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
             logger.warning(f"File not found: {file_path}")
             return None
-
-        try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                return f.read()
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {e}")
             return None
@@ -245,51 +606,78 @@ class RepositoryInspector:
         Returns:
             List of related file paths
         """
-        if target_file not in self.file_index:
+        target_index = self.file_index.get(target_file)
+        if target_index is None:
             return []
 
-        target_index = self.file_index[target_file]
-        related: dict[str, float] = {}
-
-        for file_path, file_index in self.file_index.items():
-            if file_path == target_file:
-                continue
-
-            score = 0.0
-
-            # Check import relationships
-            if any(imp in file_index.exports for imp in target_index.imports):
-                score += 10.0
-
-            if any(exp in file_index.imports for exp in target_index.exports):
-                score += 10.0
-
-            # Check path similarity
-            target_parts = Path(target_file).parts
-            file_parts = Path(file_path).parts
-            common_parts = len(set(target_parts) & set(file_parts))
-            score += common_parts * 2.0
-
-            # Check symbol overlap
-            target_symbols = {s.name for s in target_index.symbols}
-            file_symbols = {s.name for s in file_index.symbols}
-            symbol_overlap = len(target_symbols & file_symbols)
-            score += symbol_overlap * 5.0
+        if self._related_index is None:
+            self._related_index = self._build_related_index()
+        index = self._related_index
+
+        # Every file sharing something with the target gets its score from
+        # the reverse lookups; files sharing nothing are never visited
+        related: dict[str, float] = defaultdict(float)
+
+        # Check import relationships (each counts once per file)
+        for lookup, names in (
+            (index.exporters, target_index.imports),
+            (index.importers, target_index.exports),
+        ):
+            matched = {path for name in set(names) for path in lookup.get(name, ())}
+            for file_path in matched:
+                related[file_path] += 10.0
+
+        # Check path similarity
+        for part in set(Path(target_file).parts):
+            for file_path in index.path_parts.get(part, ()):
+                related[file_path] += 2.0
+
+        # Check symbol overlap
+        for name in {s.name for s in target_index.symbols}:
+            for file_path in index.symbols.get(name, ()):
+                related[file_path] += 5.0
+
+        related.pop(target_file, None)
+
+        # Select the top N by score, ties in index order, without sorting
+        # every candidate
+        position = index.position
+        top_related = heapq.nsmallest(
+            max_files, related.items(), key=lambda x: (-x[1], position[x[0]])
+        )
+        return [file_path for file_path, _ in top_related]
 
-            if score > 0:
-                related[file_path] = score
+    def _build_related_index(self) -> _RelatedIndex:
+        """Build name-to-files lookups over the current file index."""
+        index = _RelatedIndex(
+            defaultdict(list), defaultdict(list), defaultdict(list), defaultdict(list), {}
+        )
 
-        # Sort by score and return top N
-        sorted_related = sorted(related.items(), key=lambda x: x[1], reverse=True)
-        return [file_path for file_path, _ in sorted_related[:max_files]]
+        for position, (file_path, file_index) in enumerate(self.file_index.items()):
+            index.position[file_path] = position
+            for name in set(file_index.exports):
+                index.exporters[name].append(file_path)
+            for name in set(file_index.imports):
+                index.importers[name].append(file_path)
+            for part in set(Path(file_path).parts):
+                index.path_parts[part].append(file_path)
+            for name in {s.name for s in file_index.symbols}:
+                index.symbols[name].append(file_path)
+
+        return index
+
+    def _files_by_language(self) -> dict[str, list[str]]:
+        """Return the language-to-files lookup, building it on first use."""
+        if self._language_index is None:
+            by_language: dict[str, list[str]] = defaultdict(list)
+            for file_path, file_index in self.file_index.items():
+                by_language[file_index.language].append(file_path)
+            self._language_index = dict(by_language)
+        return self._language_index
 
     def get_files_by_language(self, language: str) -> list[str]:
         """Get all files of a specific language."""
-        return [
-            file_path
-            for file_path, index in self.file_index.items()
-            if index.language == language
-        ]
+        return list(self._files_by_language().get(language, ()))
 
     def search_symbols(self, name: str) -> list[tuple[str, Symbol]]:
         """
@@ -301,14 +689,19 @@ class RepositoryInspector:
         Returns:
             List of (file_path, symbol) tuples
         """
-        results: list[tuple[str, Symbol]] = []
-
-        for file_path, index in self.file_index.items():
-            for symbol in index.symbols:
-                if name.lower() in symbol.name.lower():
-                    results.append((file_path, symbol))
+        if self._symbol_search_index is None:
+            self._symbol_search_index = [
+                (file_path, symbol.name.lower(), symbol)
+                for file_path, index in self.file_index.items()
+                for symbol in index.symbols
+            ]
 
-        return results
+        needle = name.lower()
+        return [
+            (file_path, symbol)
+            for file_path, lowered, symbol in self._symbol_search_index
+            if needle in lowered
+        ]
 
     def get_modified_files(self, since: datetime) -> list[str]:
         """Get files modified since a given timestamp."""
@@ -326,10 +719,8 @@ class RepositoryInspector:
         }
 
         # Count by language
-        language_counts: dict[str, int] = {}
-        for index in self.file_index.values():
-            language_counts[index.language] = language_counts.get(index.language, 0) + 1
-
-        stats["by_language"] = language_counts
+        stats["by_language"] = {
+            language: len(paths) for language, paths in self._files_by_language().items()
+        }
 
         return stats
@@ -1,13 +1,14 @@
-"""Persistence layer - SQLite + JSON storage."""
+"""Persistence layer - SQLite storage."""
 
 from __future__ import annotations
 
-import json
 import logging
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+from pydantic import ValidationError
 
 from ..core.models import (
     AuditEvent,
@@ -16,14 +17,28 @@ from ..core.models import (
     LifecycleState,
     StateTransition,
     Task,
+    TaskStatus,
+    TaskType,
 )
+from ..utils import serialization
 
 logger = logging.getLogger(__name__)
 
 
+def _load_json_object(text: Optional[str]) -> dict[str, Any]:
+    """Decode a JSON object column, skipping the parser for NULL and empty objects."""
+    if not text or text == "{}":
+        return {}
+    value = serialization.loads(text)
+    if not isinstance(value, dict):
+        logger.warning(f"Expected a JSON object, got {type(value).__name__}; ignoring it")
+        return {}
+    return value
+
+
 class StateStore:
     """
-    State persistence using SQLite and JSON files.
+    State persistence using SQLite.
 
     Handles lifecycle state, tasks, audit events, and checkpoints.
     """
@@ -72,19 +87,36 @@ class StateStore:
         timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         metadata JSON
     );
+
+    -- Indexes for the ORDER BY ... DESC LIMIT queries below
+    CREATE INDEX IF NOT EXISTS idx_audit_type_ts ON audit_log(event_type, timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_audit_ts ON audit_log(timestamp DESC);
+    CREATE INDEX IF NOT EXISTS idx_checkpoints_created ON checkpoints(created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_transitions_ts ON state_transitions(timestamp DESC);
+    """
+
+    # Applied once per connection: WAL lets readers proceed during writes and,
+    # with synchronous=NORMAL, commits no longer fsync on every transaction
+    PRAGMAS_SQL = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
     """
 
-    def __init__(self, db_path: Path, tasks_dir: Path) -> None:
+    def __init__(self, db_path: Path) -> None:
         """
         Initialize the state store.
 
         Args:
             db_path: Path to SQLite database file
-            tasks_dir: Directory for task JSON files
         """
         self.db_path = db_path
-        self.tasks_dir = tasks_dir
-        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+
+        # One connection for the store's lifetime; sqlite3 also caches the
+        # prepared statements per connection
+        self._conn = sqlite3.connect(self.db_path)
 
         # Initialize database
         self._init_db()
@@ -94,41 +126,34 @@ class StateStore:
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        conn.executescript(self.SCHEMA_SQL)
-        conn.commit()
-        conn.close()
+        self._conn.executescript(self.PRAGMAS_SQL)
+        self._conn.executescript(self.SCHEMA_SQL)
 
         logger.info(f"Database initialized at {self.db_path}")
 
     def _init_lifecycle_state(self) -> None:
         """Initialize lifecycle state if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM lifecycle_state")
-        count = cursor.fetchone()[0]
+        count = self._conn.execute("SELECT COUNT(*) FROM lifecycle_state").fetchone()[0]
 
         if count == 0:
-            cursor.execute(
-                "INSERT INTO lifecycle_state (current_state, previous_state) VALUES (?, ?)",
-                (LifecycleState.IDLE.value, None),
-            )
-            conn.commit()
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO lifecycle_state (current_state, previous_state) VALUES (?, ?)",
+                    (LifecycleState.IDLE.value, None),
+                )
             logger.info("Initialized lifecycle state to IDLE")
 
-        conn.close()
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
 
     # Lifecycle State Methods
 
     def get_current_state(self) -> LifecycleState:
         """Get current lifecycle state."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT current_state FROM lifecycle_state WHERE id = 1")
-        row = cursor.fetchone()
-        conn.close()
+        row = self._conn.execute(
+            "SELECT current_state FROM lifecycle_state WHERE id = 1"
+        ).fetchone()
 
         if row:
             return LifecycleState(row[0])
@@ -136,53 +161,54 @@ class StateStore:
 
     def update_state(self, new_state: LifecycleState) -> None:
         """Update lifecycle state."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE lifecycle_state
-            SET previous_state = current_state,
-                current_state = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = 1
-            """,
-            (new_state.value,),
-        )
-
-        conn.commit()
-        conn.close()
+        with self._conn:
+            self._conn.execute(
+                """
+                UPDATE lifecycle_state
+                SET previous_state = current_state,
+                    current_state = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = 1
+                """,
+                (new_state.value,),
+            )
 
         logger.info(f"Updated lifecycle state to {new_state.value}")
 
     def save_transition(self, transition: StateTransition) -> None:
         """Save a state transition."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_transitions([transition])
 
-        cursor.execute(
-            """
-            INSERT INTO state_transitions (from_state, to_state, trigger, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+    def save_transitions(self, transitions: Iterable[StateTransition]) -> None:
+        """
+        Save several state transitions in one transaction.
+
+        Args:
+            transitions: Transitions to save, in order
+        """
+        rows = [
             (
                 transition.from_state.value,
                 transition.to_state.value,
                 transition.trigger,
                 transition.timestamp,
-                json.dumps(transition.metadata),
-            ),
-        )
+                serialization.dumps(transition.metadata),
+            )
+            for transition in transitions
+        ]
 
-        conn.commit()
-        conn.close()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO state_transitions (from_state, to_state, trigger, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
 
     def get_transition_history(self, limit: int = 100) -> list[StateTransition]:
         """Get state transition history."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
+        cursor = self._conn.execute(
             """
             SELECT from_state, to_state, trigger, timestamp, metadata
             FROM state_transitions
@@ -200,51 +226,43 @@ class StateStore:
                     to_state=LifecycleState(row[1]),
                     trigger=row[2],
                     timestamp=datetime.fromisoformat(row[3]),
-                    metadata=json.loads(row[4]) if row[4] else {},
+                    metadata=_load_json_object(row[4]),
                 )
             )
 
-        conn.close()
         return transitions
 
     # Task Methods
 
     def save_task(self, task: Task) -> None:
         """Save or update a task."""
-        # Save to SQLite
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         task_data = task.model_dump_json()
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO tasks (id, type, status, data, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            (task.id, task.type.value, task.status.value, task_data, task.created_at),
-        )
-
-        conn.commit()
-        conn.close()
-
-        # Save detailed JSON to file
-        task_file = self.tasks_dir / f"{task.id}.json"
-        with open(task_file, "w") as f:
-            json.dump(task.model_dump(), f, indent=2, default=str)
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO tasks (id, type, status, data, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (
+                    task.id,
+                    TaskType(task.type).value,
+                    TaskStatus(task.status).value,
+                    task_data,
+                    task.created_at,
+                ),
+            )
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
-        task_file = self.tasks_dir / f"{task_id}.json"
+        row = self._conn.execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
 
-        if not task_file.exists():
+        if row is None:
             return None
 
         try:
-            with open(task_file) as f:
-                data = json.load(f)
-                return Task(**data)
-        except Exception as e:
+            return Task.model_validate_json(row[0])
+        except ValidationError as e:
             logger.error(f"Failed to load task {task_id}: {e}")
             return None
 
@@ -252,60 +270,59 @@ class StateStore:
         """Get all tasks."""
         tasks = []
 
-        for task_file in self.tasks_dir.glob("*.json"):
+        for task_id, data in self._conn.execute("SELECT id, data FROM tasks ORDER BY created_at"):
             try:
-                with open(task_file) as f:
-                    data = json.load(f)
-                    tasks.append(Task(**data))
-            except Exception as e:
-                logger.warning(f"Failed to load task from {task_file}: {e}")
+                tasks.append(Task.model_validate_json(data))
+            except ValidationError as e:
+                logger.warning(f"Failed to load task {task_id}: {e}")
 
         return tasks
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
-        # Delete from database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        conn.commit()
-        conn.close()
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
 
-        # Delete JSON file
-        task_file = self.tasks_dir / f"{task_id}.json"
-        if task_file.exists():
-            task_file.unlink()
-            return True
-
-        return False
+        return cursor.rowcount > 0
 
     # Audit Event Methods
 
     def save_audit_event(self, event: AuditEvent) -> None:
         """Save an audit event."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_audit_events([event])
 
-        cursor.execute(
-            """
-            INSERT INTO audit_log (timestamp, event_type, event_data, actor)
-            VALUES (?, ?, ?, ?)
-            """,
-            (event.timestamp, event.event_type.value, json.dumps(event.event_data), event.actor),
-        )
+    def save_audit_events(self, events: Iterable[AuditEvent]) -> None:
+        """
+        Save several audit events in one transaction.
 
-        conn.commit()
-        conn.close()
+        Args:
+            events: Events to save, in order
+        """
+        rows = [
+            (
+                event.timestamp,
+                EventType(event.event_type).value,
+                serialization.dumps(event.event_data),
+                event.actor,
+            )
+            for event in events
+        ]
+
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO audit_log (timestamp, event_type, event_data, actor)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+            )
 
     def get_audit_events(
         self, event_type: Optional[EventType] = None, limit: int = 100
     ) -> list[AuditEvent]:
         """Get audit events."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         if event_type:
-            cursor.execute(
+            cursor = self._conn.execute(
                 """
                 SELECT id, timestamp, event_type, event_data, actor
                 FROM audit_log
@@ -313,10 +330,10 @@ class StateStore:
                 ORDER BY timestamp DESC
                 LIMIT ?
                 """,
-                (event_type.value, limit),
+                (EventType(event_type).value, limit),
             )
         else:
-            cursor.execute(
+            cursor = self._conn.execute(
                 """
                 SELECT id, timestamp, event_type, event_data, actor
                 FROM audit_log
@@ -333,60 +350,46 @@ class StateStore:
                     id=str(row[0]),
                     timestamp=datetime.fromisoformat(row[1]),
                     event_type=EventType(row[2]),
-                    event_data=json.loads(row[3]),
+                    event_data=_load_json_object(row[3]),
                     actor=row[4],
                 )
             )
 
-        conn.close()
         return events
 
     # Checkpoint Methods
 
     def save_checkpoint(self, checkpoint: Checkpoint) -> None:
         """Save a checkpoint."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO checkpoints (id, state_snapshot, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (checkpoint.id, checkpoint.model_dump_json(), checkpoint.created_at),
-        )
-
-        conn.commit()
-        conn.close()
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO checkpoints (id, state_snapshot, created_at)
+                VALUES (?, ?, ?)
+                """,
+                (checkpoint.id, checkpoint.model_dump_json(), checkpoint.created_at),
+            )
 
         logger.info(f"Saved checkpoint {checkpoint.id}")
 
     def get_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
         """Get a checkpoint by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT state_snapshot FROM checkpoints WHERE id = ?", (checkpoint_id,))
-        row = cursor.fetchone()
-        conn.close()
+        row = self._conn.execute(
+            "SELECT state_snapshot FROM checkpoints WHERE id = ?", (checkpoint_id,)
+        ).fetchone()
 
         if row:
-            return Checkpoint(**json.loads(row[0]))
+            return Checkpoint.model_validate_json(row[0])
         return None
 
     def get_latest_checkpoint(self) -> Optional[Checkpoint]:
         """Get the most recent checkpoint."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
+        row = self._conn.execute(
             "SELECT state_snapshot FROM checkpoints ORDER BY created_at DESC LIMIT 1"
-        )
-        row = cursor.fetchone()
-        conn.close()
+        ).fetchone()
 
         if row:
-            return Checkpoint(**json.loads(row[0]))
+            return Checkpoint.model_validate_json(row[0])
         return None
 
     def cleanup_old_checkpoints(self, keep_count: int = 10) -> int:
@@ -399,24 +402,19 @@ class StateStore:
         Returns:
             Number of checkpoints deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            DELETE FROM checkpoints
-            WHERE id NOT IN (
-                SELECT id FROM checkpoints
-                ORDER BY created_at DESC
-                LIMIT ?
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM checkpoints
+                WHERE id NOT IN (
+                    SELECT id FROM checkpoints
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                )
+                """,
+                (keep_count,),
             )
-            """,
-            (keep_count,),
-        )
 
         deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-
         logger.info(f"Cleaned up {deleted} old checkpoints")
         return deleted
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
+import mmap
 import re
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +16,26 @@ from ..core.models import PolicySeverity, PolicyType, PolicyViolation
 
 logger = logging.getLogger(__name__)
 
+# Severity ordinals for get_by_severity, INFO lowest
+_SEVERITY_ORDER = {
+    PolicySeverity.INFO: 0,
+    PolicySeverity.WARNING: 1,
+    PolicySeverity.ERROR: 2,
+    PolicySeverity.CRITICAL: 3,
+}
+
+# Upper-cased labels for format_violations
+_SEVERITY_LABELS = {severity: severity.value.upper() for severity in PolicySeverity}
+_TYPE_LABELS = {policy_type: policy_type.value.upper() for policy_type in PolicyType}
+
+
+def _scan_pattern(
+    index: int, name: str, pattern: re.Pattern[str], text: str
+) -> Iterator[tuple[int, int, str, str]]:
+    """Yield (start, pattern index, group name, matched text) for each match."""
+    for match in pattern.finditer(text):
+        yield match.start(), index, name, match.group()
+
 
 class PolicyEngine:
     """
@@ -28,9 +52,19 @@ class PolicyEngine:
             config: Configuration object
         """
         self.config = config
-        self._secret_patterns = [
-            re.compile(pattern) for pattern in config.policies.security.secret_patterns
-        ]
+        security = config.policies.security
+        self._secret_pattern = security.compiled_secret_pattern
+        self._secret_patterns = security.compiled_secret_patterns
+        self._secret_pattern_bytes = security.compiled_secret_pattern_bytes
+        self._secret_pattern_groups = security.secret_pattern_groups
+        self._prohibited_substrings, self._prohibited_globs = (
+            config.policies.safety.compiled_prohibited_paths
+        )
+        # The patterns are fixed for the engine's lifetime, so each path
+        # only needs checking once
+        self._is_prohibited_path: Callable[[str], bool] = functools.lru_cache(maxsize=4096)(
+            self._is_prohibited_path_uncached
+        )
 
     def validate_all(self, context: dict[str, Any]) -> list[PolicyViolation]:
         """
@@ -145,6 +179,12 @@ class PolicyEngine:
                 )
             )
 
+        # Both limits above block the task already. With fail_fast, skip the
+        # per-file checks, which are most expensive exactly when a limit is
+        # blown, at the cost of not reporting prohibited paths.
+        if violations and self.config.policies.safety.fail_fast:
+            return violations
+
         # Prohibited paths
         for file_path in modified_files:
             if self._is_prohibited_path(file_path):
@@ -165,40 +205,96 @@ class PolicyEngine:
         """
         Scan for potential secrets in code.
 
+        ``files_content`` maps each file to its text, or to a Path; paths are
+        memory-mapped and scanned as bytes instead of being read into memory.
+
         Args:
             context: Validation context
 
         Returns:
             List of secret violations
         """
+        if not self._secret_patterns:
+            return []
+
         violations: list[PolicyViolation] = []
         files_content = context.get("files_content", {})
 
         for file_path, content in files_content.items():
-            for pattern in self._secret_patterns:
-                matches = pattern.finditer(content)
-                for match in matches:
-                    violations.append(
-                        PolicyViolation(
-                            policy_type=PolicyType.SECURITY,
-                            policy_name="secret_scanning",
-                            severity=PolicySeverity.CRITICAL,
-                            message=f"Potential secret detected in {file_path}: {match.group()}",
-                            blocking=True,
-                            context={
-                                "file": file_path,
-                                "pattern": pattern.pattern,
-                                "match": match.group(),
-                            },
-                        )
+            for group, matched in self._find_secrets(content):
+                violations.append(
+                    PolicyViolation(
+                        policy_type=PolicyType.SECURITY,
+                        policy_name="secret_scanning",
+                        severity=PolicySeverity.CRITICAL,
+                        message=f"Potential secret detected in {file_path}: {matched}",
+                        blocking=True,
+                        context={
+                            "file": file_path,
+                            "pattern": self._secret_pattern_groups[group],
+                            "match": matched,
+                        },
                     )
+                )
 
         return violations
 
-    def _is_prohibited_path(self, file_path: str) -> bool:
+    def _find_secrets(self, content: str | Path) -> Iterator[tuple[str, str]]:
+        """
+        Yield secret matches in text or in a file.
+
+        Args:
+            content: Text to scan, or path of a file to scan in place
+
+        Yields:
+            (group name of the matching pattern, matched text) tuples
+        """
+        if isinstance(content, str):
+            yield from self._find_secrets_in_text(content)
+        elif self._secret_pattern_bytes is None:
+            text = content.read_text(encoding="utf-8", errors="replace")
+            yield from self._find_secrets_in_text(text)
+        else:
+            yield from self._find_secrets_in_file(content, self._secret_pattern_bytes)
+
+    def _find_secrets_in_text(self, text: str) -> Iterator[tuple[str, str]]:
+        """Yield (group name, matched text) for each secret match in text."""
+        if self._secret_pattern is not None:
+            for match in self._secret_pattern.finditer(text):
+                # Every alternative is a named group, so lastgroup is always set
+                if match.lastgroup is not None:
+                    yield match.lastgroup, match.group()
+            return
+
+        # Patterns that can't be fused are scanned one by one, and their
+        # matches merged back into text order
+        scans = [
+            _scan_pattern(index, name, pattern, text)
+            for index, (name, pattern) in enumerate(self._secret_patterns.items())
+        ]
+        for _, _, name, matched in heapq.merge(*scans):
+            yield name, matched
+
+    @staticmethod
+    def _find_secrets_in_file(path: Path, pattern: re.Pattern[bytes]) -> Iterator[tuple[str, str]]:
+        """Yield (group name, matched text) for each match in a memory-mapped file."""
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            with mapped:
+                for match in pattern.finditer(mapped):
+                    if match.lastgroup is not None:
+                        yield match.lastgroup, match.group().decode("utf-8", errors="replace")
+
+    def _is_prohibited_path_uncached(self, file_path: str) -> bool:
         """
         Check if a file path is prohibited.
 
+        Called through the engine's per-instance cache, ``_is_prohibited_path``.
+
         Args:
             file_path: File path to check
 
@@ -206,13 +302,19 @@ class PolicyEngine:
             True if prohibited
         """
         path = Path(file_path)
+        path_str = str(path)
+
+        for pattern in self._prohibited_substrings:
+            if pattern in path_str:
+                return True
 
-        for pattern in self.config.policies.safety.prohibited_paths:
-            # Simple glob matching
-            if "*" in pattern:
-                if path.match(pattern):
-                    return True
-            elif pattern in str(path):
+        # Glob matching against the trailing path components
+        parts = path.parts
+        for absolute, regexes in self._prohibited_globs:
+            count = len(regexes)
+            if len(parts) < count or (absolute and len(parts) != count):
+                continue
+            if all(regex.match(part) for regex, part in zip(regexes, parts[-count:], strict=True)):
                 return True
 
         return False
@@ -242,15 +344,8 @@ class PolicyEngine:
         Returns:
             Filtered violations
         """
-        severity_order = {
-            PolicySeverity.INFO: 0,
-            PolicySeverity.WARNING: 1,
-            PolicySeverity.ERROR: 2,
-            PolicySeverity.CRITICAL: 3,
-        }
-
-        min_level = severity_order[min_severity]
-        return [v for v in violations if severity_order[v.severity] >= min_level]
+        min_level = _SEVERITY_ORDER[min_severity]
+        return [v for v in violations if _SEVERITY_ORDER[v.severity] >= min_level]
 
     def format_violations(self, violations: list[PolicyViolation]) -> str:
         """
@@ -269,10 +364,13 @@ class PolicyEngine:
 
         for v in violations:
             icon = "🔴" if v.blocking else "⚠️"
-            lines.append(f"{icon} [{v.severity.upper()}] {v.policy_type.upper()}/{v.policy_name}")
-            lines.append(f"   {v.message}")
+            header = (
+                f"{icon} [{_SEVERITY_LABELS[v.severity]}] "
+                f"{_TYPE_LABELS[v.policy_type]}/{v.policy_name}"
+            )
             if v.context:
-                lines.append(f"   Context: {v.context}")
-            lines.append("")
+                lines.extend((header, f"   {v.message}", f"   Context: {v.context}", ""))
+            else:
+                lines.extend((header, f"   {v.message}", ""))
 
         return "\n".join(lines)
@@ -17,7 +17,7 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """Health check result."""
 
@@ -49,7 +49,7 @@ class Provider(ABC):
 # Git Provider Types
 
 
-@dataclass
+@dataclass(slots=True)
 class Repo:
     """Repository representation."""
 
@@ -65,7 +65,7 @@ class Repo:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class Branch:
     """Branch representation."""
 
@@ -74,7 +74,7 @@ class Branch:
     repo: Repo
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
     """Pull request specification."""
 
@@ -85,7 +85,7 @@ class PullRequest:
     draft: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PR:
     """Created pull request."""
 
@@ -96,7 +96,7 @@ class PR:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Merge operation result."""
 
@@ -137,7 +137,7 @@ class GitProvider(Provider):
 # CI Provider Types
 
 
-@dataclass
+@dataclass(slots=True)
 class Build:
     """CI build representation."""
 
@@ -186,7 +186,7 @@ class CIProvider(Provider):
 # Hosting Provider Types
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """Build artifact."""
 
@@ -196,7 +196,7 @@ class Artifact:
     hash: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment:
     """Deployment environment."""
 
@@ -210,7 +210,7 @@ class Environment:
             self.config = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class Deployment:
     """Deployment representation."""
 
@@ -258,7 +258,7 @@ class HostingProvider(Provider):
 # Secrets Provider
 
 
-@dataclass
+@dataclass(slots=True)
 class Secret:
     """Secret representation."""
 
@@ -2,25 +2,118 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 import httpx
 
 from .base import (
+    PR,
     Branch,
     GitProvider,
     HealthCheck,
     HealthStatus,
     MergeResult,
-    PR,
     PullRequest,
     Repo,
 )
 
 logger = logging.getLogger(__name__)
 
+# httpx negotiates HTTP/2 only when h2 (the ``fast`` extra) is installed; look
+# for it without importing it, since nothing here uses it directly
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+
+# Methods safe to resend after a server error
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """Check for GitHub's primary or secondary rate limit responses."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        response.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in response.headers
+    )
+
+
+class _RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that retries rate-limited and failed requests with backoff.
+
+    Rate-limited requests were rejected outright, so they are retried for
+    any method; 5xx responses only for idempotent methods.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        max_delay_seconds: float = 60.0,
+    ) -> None:
+        """
+        Initialize the retry transport.
+
+        Args:
+            transport: Transport that sends the requests
+            max_retries: Retries after the first attempt
+            backoff_seconds: Delay before the first retry, doubled per retry
+            max_delay_seconds: Upper bound on any single delay
+        """
+        self._transport = transport
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying while the response is retryable."""
+        for attempt in range(self.max_retries + 1):
+            response = await self._transport.handle_async_request(request)
+            if attempt == self.max_retries or not self._should_retry(request, response):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            await response.aclose()
+            logger.debug(
+                "Retrying %s %s after %s in %.1fs",
+                request.method,
+                request.url,
+                response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+        return response
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Check whether a response should be retried."""
+        if _is_rate_limited(response):
+            return True
+        return response.status_code >= 500 and request.method in _IDEMPOTENT_METHODS
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get the delay before the next attempt, honoring rate limit headers."""
+        delay: float = self.backoff_seconds * 2**attempt
+        retry_after = response.headers.get("retry-after")
+        reset_at = response.headers.get("x-ratelimit-reset")
+        try:
+            if retry_after is not None:
+                delay = max(delay, float(retry_after))
+            elif reset_at is not None and response.headers.get("x-ratelimit-remaining") == "0":
+                delay = max(delay, float(reset_at) - time.time())
+        except ValueError:
+            pass
+        return min(delay, self.max_delay_seconds)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
 
 class GitHubProvider(GitProvider):
     """GitHub API provider implementation."""
@@ -35,6 +128,9 @@ class GitHubProvider(GitProvider):
         """
         self.token = token
         self.base_url = base_url.rstrip("/")
+        # One pooled client for all calls; HTTP/2 multiplexes concurrent
+        # requests over a single connection when h2 is installed
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
         self.client = httpx.AsyncClient(
             headers={
                 "Authorization": f"Bearer {token}",
@@ -42,15 +138,18 @@ class GitHubProvider(GitProvider):
                 "X-GitHub-Api-Version": "2022-11-28",
             },
             timeout=30.0,
+            transport=_RetryTransport(
+                httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=1)
+            ),
         )
 
     async def health_check(self) -> HealthCheck:
         """Check GitHub API health."""
-        start = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         try:
             response = await self.client.get(f"{self.base_url}/")
-            latency_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             if response.status_code == 200:
                 return HealthCheck(
@@ -65,7 +164,7 @@ class GitHubProvider(GitProvider):
                     message=f"GitHub API returned {response.status_code}",
                 )
         except Exception as e:
-            latency_ms = int((datetime.utcnow() - start).total_seconds() * 1000)
+            latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return HealthCheck(
                 status=HealthStatus.UNHEALTHY,
                 latency_ms=latency_ms,
@@ -174,7 +273,7 @@ class GitHubProvider(GitProvider):
         )
         response.raise_for_status()
 
-        return response.json()["state"]
+        return cast(str, response.json()["state"])
 
     async def close(self) -> None:
         """Close the HTTP client."""
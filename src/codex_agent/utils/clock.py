@@ -0,0 +1,29 @@
+"""Wall-clock helpers."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+__all__ = ["utcnow"]
+
+utcnow: Callable[[], datetime]
+
+if sys.version_info >= (3, 12):
+
+    def utcnow() -> datetime:
+        """
+        Get the current UTC time as a naive datetime.
+
+        Same result as ``datetime.utcnow()`` without its DeprecationWarning,
+        which is issued on every call from Python 3.12.
+
+        Returns:
+            Naive datetime in UTC
+        """
+        return datetime.now(UTC).replace(tzinfo=None)
+
+else:
+    # Not deprecated here, and the C implementation is the fastest option
+    utcnow = datetime.utcnow
@@ -1,14 +1,31 @@
 """Logging and observability configuration."""
 
 import logging
-import sys
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass
+from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+from . import serialization
+
+
+class _SharedFormatter(logging.Formatter):
+    """Formatter that formats each record once for all handlers sharing it."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the text if another handler formatted it."""
+        cached = record.__dict__.get("_codex_formatted")
+        if cached is not None and cached[0] is self:
+            return cast(str, cached[1])
+
+        text = super().format(record)
+        record._codex_formatted = (self, text)
+        return text
+
 
 class CodexLogger:
     """
@@ -22,6 +39,8 @@ class CodexLogger:
         log_dir: Optional[Path] = None,
         log_level: str = "INFO",
         verbose: bool = False,
+        backup_count: int = 14,
+        log_to_files: bool = True,
     ) -> None:
         """
         Initialize logging configuration.
@@ -30,13 +49,18 @@ class CodexLogger:
             log_dir: Directory for log files
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             verbose: Enable verbose logging
+            backup_count: Rotated daily log files to keep
+            log_to_files: Write log files; False logs to the console only
         """
         self.log_dir = log_dir or Path(".codex/logs")
         self.log_level = logging.DEBUG if verbose else getattr(logging, log_level.upper())
         self.verbose = verbose
+        self.backup_count = backup_count
+        self.log_to_files = log_to_files
 
         # Ensure log directory exists
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        if log_to_files:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # Configure root logger
         self._configure_root_logger()
@@ -64,11 +88,15 @@ class CodexLogger:
         console_handler.setFormatter(console_formatter)
         root_logger.addHandler(console_handler)
 
-        # File handler for all logs
-        log_file = self.log_dir / f"{datetime.now().strftime('%Y-%m-%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        if not self.log_to_files:
+            return
+
+        # File handler for all logs, rotated at midnight so long-running
+        # processes roll over to a new file (codex.log.YYYY-MM-DD)
+        file_handler = self._rotating_handler("codex.log")
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
+        # Shared by both file handlers, so error records are formatted once
+        file_formatter = _SharedFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
@@ -76,12 +104,20 @@ class CodexLogger:
         root_logger.addHandler(file_handler)
 
         # Error file handler
-        error_log_file = self.log_dir / f"{datetime.now().strftime('%Y-%m-%d')}_errors.log"
-        error_file_handler = logging.FileHandler(error_log_file, encoding="utf-8")
+        error_file_handler = self._rotating_handler("codex_errors.log")
         error_file_handler.setLevel(logging.ERROR)
         error_file_handler.setFormatter(file_formatter)
         root_logger.addHandler(error_file_handler)
 
+    def _rotating_handler(self, file_name: str) -> TimedRotatingFileHandler:
+        """Create a file handler in the log directory that rotates daily."""
+        return TimedRotatingFileHandler(
+            self.log_dir / file_name,
+            when="midnight",
+            backupCount=self.backup_count,
+            encoding="utf-8",
+        )
+
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         """
@@ -100,6 +136,7 @@ def setup_logging(
     log_dir: Optional[Path] = None,
     log_level: str = "INFO",
     verbose: bool = False,
+    log_to_files: bool = True,
 ) -> CodexLogger:
     """
     Set up logging for the application.
@@ -108,11 +145,14 @@ def setup_logging(
         log_dir: Directory for log files
         log_level: Logging level
         verbose: Enable verbose logging
+        log_to_files: Write log files; False logs to the console only
 
     Returns:
         Configured CodexLogger instance
     """
-    return CodexLogger(log_dir=log_dir, log_level=log_level, verbose=verbose)
+    return CodexLogger(
+        log_dir=log_dir, log_level=log_level, verbose=verbose, log_to_files=log_to_files
+    )
 
 
 class AuditLogger:
@@ -154,45 +194,72 @@ class AuditLogger:
             event_type: Type of event (e.g., 'state_change', 'deployment')
             details: Event details as dictionary
         """
-        import json
-
-        message = f"{event_type}: {json.dumps(details, default=str)}"
+        message = f"{event_type}: {serialization.dumps(details)}"
         self.logger.info(message)
 
 
+@dataclass(slots=True)
+class _RunningStats:
+    """Running aggregates of a duration metric."""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+
 class MetricsCollector:
     """
     Simple metrics collector for tracking agent performance.
 
+    Durations are kept as running aggregates plus a bounded window of recent
+    samples, so memory stays flat and stats are O(1) in long-running agents.
+
     In production, this could be replaced with Prometheus or similar.
     """
 
-    def __init__(self) -> None:
-        """Initialize metrics collector."""
-        self.metrics: dict[str, list[float]] = {}
+    def __init__(self, max_samples: int = 1000) -> None:
+        """
+        Initialize metrics collector.
+
+        Args:
+            max_samples: Recent samples kept per duration metric
+        """
+        self.max_samples = max_samples
+        self.metrics: dict[str, deque[float]] = {}
         self.counters: dict[str, int] = {}
+        self._stats: dict[str, _RunningStats] = {}
 
     def record_duration(self, metric_name: str, duration_ms: float) -> None:
         """Record a duration metric."""
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
+        stats = self._stats.get(metric_name)
+        if stats is None:
+            stats = self._stats[metric_name] = _RunningStats()
+            self.metrics[metric_name] = deque(maxlen=self.max_samples)
         self.metrics[metric_name].append(duration_ms)
 
+        stats.count += 1
+        stats.total += duration_ms
+        if duration_ms < stats.min:
+            stats.min = duration_ms
+        if duration_ms > stats.max:
+            stats.max = duration_ms
+
     def increment_counter(self, counter_name: str, value: int = 1) -> None:
         """Increment a counter."""
         self.counters[counter_name] = self.counters.get(counter_name, 0) + value
 
     def get_stats(self, metric_name: str) -> dict[str, float]:
-        """Get statistics for a metric."""
-        if metric_name not in self.metrics:
+        """Get statistics for a metric, over every sample recorded."""
+        stats = self._stats.get(metric_name)
+        if stats is None:
             return {}
 
-        values = self.metrics[metric_name]
         return {
-            "count": len(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
+            "count": stats.count,
+            "min": stats.min,
+            "max": stats.max,
+            "avg": stats.total / stats.count,
         }
 
     def get_counter(self, counter_name: str) -> int:
@@ -203,6 +270,7 @@ class MetricsCollector:
         """Reset all metrics."""
         self.metrics.clear()
         self.counters.clear()
+        self._stats.clear()
 
 
 # Global metrics instance
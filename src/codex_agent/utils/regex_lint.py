@@ -0,0 +1,121 @@
+"""Static checks for regexes prone to catastrophic backtracking.
+
+The check walks the parse tree from CPython's regex parser. That parser is
+private (``re._parser``) and not a stable API, so it is loaded defensively:
+where it is missing or its layout differs, patterns are not linted.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, NamedTuple, Optional
+
+__all__ = ["has_nested_unbounded_repeat"]
+
+
+class _Parser(NamedTuple):
+    """The parts of CPython's private regex parser the lint relies on."""
+
+    parse: Any
+    subpattern_type: type
+    max_repeat: int
+    repeat_ops: tuple[Any, ...]
+    group_ops: tuple[Any, ...]
+    zero_width_ops: tuple[Any, ...]
+
+
+def _load_parser() -> Optional[_Parser]:
+    """Load the private regex parser, or None if this interpreter lacks it."""
+    try:
+        parser: Any = importlib.import_module("re._parser")
+        constants: Any = importlib.import_module("re._constants")
+        return _Parser(
+            parse=parser.parse,
+            subpattern_type=parser.SubPattern,
+            max_repeat=constants.MAXREPEAT,
+            repeat_ops=(constants.MAX_REPEAT, constants.MIN_REPEAT),
+            group_ops=(constants.SUBPATTERN, constants.BRANCH),
+            zero_width_ops=(constants.AT, constants.ASSERT, constants.ASSERT_NOT),
+        )
+    except (ImportError, AttributeError):  # pragma: no cover - depends on the interpreter
+        return None
+
+
+_PARSER = _load_parser()
+
+
+def _subpatterns(parser: _Parser, av: Any) -> list[Any]:
+    """Get the nested parsed subpatterns among an opcode's arguments."""
+    found = []
+    for arg in av if isinstance(av, (tuple, list)) else (av,):
+        for sub in arg if isinstance(arg, list) else (arg,):
+            if isinstance(sub, parser.subpattern_type):
+                found.append(sub)
+    return found
+
+
+def _repeats_only(parser: _Parser, items: Any) -> Optional[bool]:
+    """
+    Check whether a parsed regex consists of nothing but repeats.
+
+    Args:
+        parser: Loaded regex parser
+        items: Parsed pattern
+
+    Returns:
+        None if it has a required token outside any repeat, otherwise whether
+        it contains an unbounded repeat
+    """
+    has_unbounded = False
+    for op, av in items:
+        if op in parser.repeat_ops:
+            min_count, max_count, body = av
+            if max_count == parser.max_repeat:
+                has_unbounded = True
+            elif min_count > 0:
+                inner = _repeats_only(parser, body)
+                if inner is None:
+                    return None
+                has_unbounded = has_unbounded or inner
+        elif op in parser.group_ops:
+            results = [_repeats_only(parser, sub) for sub in _subpatterns(parser, av)]
+            if any(results):
+                has_unbounded = True
+            elif all(result is None for result in results):
+                return None
+        elif op not in parser.zero_width_ops:
+            return None
+    return has_unbounded
+
+
+def _nests_unbounded_repeat(parser: _Parser, items: Any) -> bool:
+    """Check a parsed regex for an unbounded repeat of nothing but repeats."""
+    for op, av in items:
+        if op in parser.repeat_ops:
+            _, max_count, body = av
+            if max_count == parser.max_repeat and _repeats_only(parser, body):
+                return True
+        if any(_nests_unbounded_repeat(parser, sub) for sub in _subpatterns(parser, av)):
+            return True
+    return False
+
+
+def has_nested_unbounded_repeat(pattern: str) -> bool:
+    """
+    Check a regex for an unbounded repeat of nothing but repeats.
+
+    Shapes like ``(a+)+`` or ``(\\w+\\s?)*`` can split the same input
+    between iterations in exponentially many ways, so a near-match
+    backtracks catastrophically. A repeated body with a required token of
+    its own, as in ``(?:-[a-z]+)*``, is not flagged.
+
+    Args:
+        pattern: Regex source; it must already compile
+
+    Returns:
+        True if the pattern nests unbounded repeats ambiguously, False if it
+        doesn't or the regex parser is unavailable
+    """
+    if _PARSER is None:
+        return False
+    return _nests_unbounded_repeat(_PARSER, _PARSER.parse(pattern))
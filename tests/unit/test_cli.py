@@ -0,0 +1,75 @@
+"""Tests for the CLI entry point."""
+
+import json
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from codex_agent.cli.main import LAZY_SUBCOMMANDS, app
+
+
+@pytest.fixture
+def runner():
+    """Create a CLI runner."""
+    return CliRunner()
+
+
+def test_help_lists_lazy_commands(runner):
+    """Test that --help enumerates every lazily registered command."""
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_SUBCOMMANDS:
+        assert name in result.output
+
+
+def test_version(runner):
+    """Test the --version flag."""
+    result = runner.invoke(app, ["--version"])
+
+    assert result.exit_code == 0
+    assert "Codex Lifecycle Agent v" in result.output
+
+
+def test_invalid_deploy_environment(runner):
+    """Test that deploy rejects unknown environments."""
+    result = runner.invoke(app, ["deploy", "qa"])
+
+    assert result.exit_code == 2
+    assert "codex_agent.cli.commands.deploy" in sys.modules
+
+
+def test_init_dry_run(runner, tmp_path, monkeypatch):
+    """Test that init --dry-run creates nothing."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["init", "demo", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert not (tmp_path / ".codex").exists()
+
+
+def test_config_show_outputs_json(runner, tmp_path, monkeypatch):
+    """Test that config show prints parseable JSON."""
+    monkeypatch.chdir(tmp_path)
+    assert runner.invoke(app, ["init", "demo"]).exit_code == 0
+
+    result = runner.invoke(app, ["config", "show"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)["project"]["name"] == "demo"
+
+
+def test_status_json(runner, tmp_path, monkeypatch):
+    """Test that status --json prints parseable JSON."""
+    monkeypatch.chdir(tmp_path)
+    assert runner.invoke(app, ["init", "demo"]).exit_code == 0
+
+    result = runner.invoke(app, ["status", "--json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {
+        "state": "IDLE",
+        "project": "demo",
+        "stack": "python-postgres",
+    }
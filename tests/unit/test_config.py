@@ -0,0 +1,162 @@
+"""Tests for configuration loading."""
+
+import pytest
+from pydantic import ValidationError
+
+from codex_agent.core.config import Config, ProjectConfig
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal config file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("project:\n  name: test-project\n  stack: python-postgres\n")
+    return path
+
+
+def test_load_from_file(config_file):
+    """Test loading a config file."""
+    config = Config.load_from_file(config_file)
+
+    assert config.project.name == "test-project"
+    assert config.project.stack == "python-postgres"
+
+
+def test_load_from_file_missing(tmp_path):
+    """Test that a missing config file raises."""
+    with pytest.raises(FileNotFoundError):
+        Config.load_from_file(tmp_path / "missing.yaml")
+
+
+def test_load_from_file_is_cached(config_file):
+    """Test that unchanged files are served from the cache."""
+    first = Config.load_from_file(config_file)
+    second = Config.load_from_file(config_file)
+
+    assert first is second
+
+
+def test_load_from_file_invalidated_on_change(config_file):
+    """Test that editing the file invalidates the cache."""
+    first = Config.load_from_file(config_file)
+    config_file.write_text("project:\n  name: renamed-project\n  stack: node-postgres\n")
+
+    second = Config.load_from_file(config_file)
+    assert second is not first
+    assert second.project.name == "renamed-project"
+
+
+def test_save_and_reload(tmp_path):
+    """Test that a saved config can be loaded back."""
+    path = tmp_path / "config.yaml"
+    Config(project=ProjectConfig(name="roundtrip", stack="python-postgres")).save_to_file(path)
+
+    config = Config.load_from_file(path)
+    assert config.project.name == "roundtrip"
+    assert config.codex_dir == Config.model_fields["codex_dir"].default
+
+
+def test_load_from_file_writes_json_cache(config_file):
+    """Test that the parsed YAML is precompiled to JSON and reused."""
+    from codex_agent.core import config as config_module
+
+    Config.load_from_file(config_file)
+    json_path = config_file.with_name("config.yaml.json")
+    assert json_path.exists()
+
+    # A new process has an empty in-memory cache but can reuse the JSON copy
+    config_module._CONFIG_CACHE.clear()
+    assert Config.load_from_file(config_file).project.name == "test-project"
+
+
+def test_load_from_file_json_cache_is_lossless(config_file):
+    """Test that a file loads the same way with or without the JSON copy."""
+    from codex_agent.core import config as config_module
+
+    # YAML parses an unquoted date as a datetime.date, which ``version: str`` rejects
+    config_file.write_text(
+        "project:\n  name: test-project\n  stack: python-postgres\n  version: 2024-01-01\n"
+    )
+    for _ in range(2):
+        config_module._CONFIG_CACHE.clear()
+        with pytest.raises(ValidationError):
+            Config.load_from_file(config_file)
+    assert not config_file.with_name("config.yaml.json").exists()
+
+
+def test_ensure_directories(tmp_path):
+    """Test that the state directory tree is created."""
+    codex_dir = tmp_path / ".codex"
+    config = Config(
+        project=ProjectConfig(name="dirs", stack="python-postgres"),
+        codex_dir=codex_dir,
+        log_dir=codex_dir / "logs",
+        cache_dir=tmp_path / "shared-cache",
+    )
+    config.ensure_directories()
+
+    for sub in ("checkpoints", "logs", "cache", "artifacts"):
+        assert (codex_dir / sub).is_dir()
+    assert not (codex_dir / "tasks").exists()
+    assert (tmp_path / "shared-cache").is_dir()
+
+
+def test_nested_env_overrides(monkeypatch):
+    """Test that nested sections are populated from CODEX_<SECTION>__<FIELD>."""
+    monkeypatch.setenv("CODEX_LLM__MODEL", "gpt-4o")
+    monkeypatch.setenv("CODEX_GIT__TOKEN", "ghp_test")
+
+    config = Config(project=ProjectConfig(name="env", stack="python-postgres"))
+
+    assert config.llm.model == "gpt-4o"
+    assert config.llm.provider == "openai"
+    assert config.git.token == "ghp_test"
+
+
+def test_config_is_read_only(config_file):
+    """Test that shared cached configs cannot be mutated."""
+    config = Config.load_from_file(config_file)
+
+    with pytest.raises(ValidationError):
+        config.llm.model = "other"
+    with pytest.raises(ValidationError):
+        config.codex_dir = config_file.parent
+
+
+@pytest.mark.parametrize("pattern", [r"(a+)+$", r"(\w+\s?)*=", r"(?i)(key|\d+)*", "[unclosed"])
+def test_unsafe_secret_patterns_rejected(pattern):
+    """Test that invalid or catastrophically backtracking secret patterns fail to load."""
+    with pytest.raises(ValidationError):
+        Config(
+            project=ProjectConfig(name="test-project", stack="python-postgres"),
+            policies={"security": {"secret_patterns": [pattern]}},
+        )
+
+
+def test_safe_secret_patterns_accepted():
+    """Test that nested repeats with a required token of their own are allowed."""
+    patterns = [r"(?i)api[_-]?key", r"[a-z]+(?:-[a-z]+)*", r"(?:\s*\w+=)+", r"ghp_\w{36}"]
+    config = Config(
+        project=ProjectConfig(name="test-project", stack="python-postgres"),
+        policies={"security": {"secret_patterns": patterns}},
+    )
+
+    assert config.policies.security.secret_patterns == patterns
+
+
+def test_backtracking_lint_skipped_without_regex_parser(monkeypatch):
+    """Test that patterns still load when the private regex parser is unavailable."""
+    from codex_agent.utils import regex_lint
+
+    monkeypatch.setattr(regex_lint, "_PARSER", None)
+    config = Config(
+        project=ProjectConfig(name="test-project", stack="python-postgres"),
+        policies={"security": {"secret_patterns": [r"(a+)+"]}},
+    )
+
+    assert config.policies.security.secret_patterns == [r"(a+)+"]
+    with pytest.raises(ValidationError):
+        Config(
+            project=ProjectConfig(name="test-project", stack="python-postgres"),
+            policies={"security": {"secret_patterns": [r"(unclosed"]}},
+        )
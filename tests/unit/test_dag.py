@@ -73,6 +73,21 @@ def test_cycle_detection(dag):
         dag.add_task(task2)
 
 
+def test_rejected_task_leaves_no_edges(dag):
+    """Test that a task rejected for a cycle is fully rolled back."""
+    dag.add_task(
+        Task(id="a", type=TaskType.IMPLEMENT, title="A", description="A", dependencies=["b"])
+    )
+    with pytest.raises(DAGCycleError):
+        dag.add_task(
+            Task(id="b", type=TaskType.IMPLEMENT, title="B", description="B", dependencies=["a"])
+        )
+
+    assert dag.get_task("b") is None
+    assert dag.get_task_dependents("a") == []
+    assert [t.id for t in dag.get_task_dependencies("a")] == []
+
+
 def test_topological_sort(dag, sample_tasks):
     """Test topological sorting."""
     for task in sample_tasks:
@@ -86,6 +101,51 @@ def test_topological_sort(dag, sample_tasks):
     assert task_ids.index("task2") < task_ids.index("task3")
 
 
+def test_topological_sort_ignores_missing_dependencies(dag):
+    """Test that a dependency outside the DAG is not mistaken for a cycle."""
+    dag.add_task(
+        Task(id="a", type=TaskType.TEST, title="A", description="A", dependencies=["missing"])
+    )
+    dag.add_task(Task(id="b", type=TaskType.TEST, title="B", description="B", dependencies=["a"]))
+
+    assert [t.id for t in dag.topological_sort()] == ["a", "b"]
+
+    dag.remove_task("a")
+    assert [t.id for t in dag.topological_sort()] == ["b"]
+
+
+def test_frozen_graph_matches_mutable_graph(dag, sample_tasks):
+    """Test that the CSR snapshot gives the same order and is dropped on change."""
+    for task in sample_tasks:
+        dag.add_task(task)
+    expected = [t.id for t in dag.topological_sort()]
+
+    dag.freeze()
+    assert [t.id for t in dag.topological_sort()] == expected
+    assert dag.validate() == []
+
+    dag.add_task(Task(id="task4", type=TaskType.TEST, title="4", description="4"))
+    assert [t.id for t in dag.topological_sort()] == ["task1", "task4", "task2", "task3"]
+
+
+def test_duplicate_dependency_is_one_edge(dag, sample_tasks):
+    """Test that listing a dependency twice doesn't stall the task."""
+    dag.add_task(sample_tasks[0])
+    dag.add_task(
+        Task(
+            id="dup",
+            type=TaskType.TEST,
+            title="Dup",
+            description="Lists task1 twice",
+            dependencies=["task1", "task1"],
+        )
+    )
+
+    assert [t.id for t in dag.topological_sort()] == ["task1", "dup"]
+    dag.notify_status_change("task1", TaskStatus.COMPLETED)
+    assert dag.get_next_task().id == "dup"
+
+
 def test_get_ready_tasks(dag, sample_tasks):
     """Test getting ready tasks."""
     for task in sample_tasks:
@@ -103,6 +163,23 @@ def test_get_ready_tasks(dag, sample_tasks):
     assert ready[0].id == "task2"
 
 
+def test_get_ready_tasks_limit(dag):
+    """Test that a limit returns the highest-priority ready tasks in order."""
+    for task_id, priority in [("low", 3), ("high", 1), ("mid", 2)]:
+        dag.add_task(
+            Task(
+                id=task_id,
+                type=TaskType.IMPLEMENT,
+                title=task_id,
+                description="Independent",
+                priority=priority,
+            )
+        )
+
+    assert [t.id for t in dag.get_ready_tasks(limit=2)] == ["high", "mid"]
+    assert [t.id for t in dag.get_ready_tasks(limit=5)] == ["high", "mid", "low"]
+
+
 def test_get_next_task(dag, sample_tasks):
     """Test getting the next task to execute."""
     for task in sample_tasks:
@@ -112,10 +189,28 @@ def test_get_next_task(dag, sample_tasks):
     assert next_task.id == "task1"
 
     # Complete task1
-    dag.get_task("task1").status = TaskStatus.COMPLETED
+    dag.notify_status_change("task1", TaskStatus.COMPLETED)
     next_task = dag.get_next_task()
     assert next_task.id == "task2"
 
+    # Running tasks are no longer offered
+    dag.notify_status_change("task2", TaskStatus.RUNNING)
+    assert dag.get_next_task() is None
+
+
+def test_next_task_waits_for_late_dependency(dag):
+    """Test that adding a pending dependency holds back its dependent."""
+    dag.add_task(
+        Task(id="b", type=TaskType.TEST, title="B", description="B", dependencies=["a"])
+    )
+    assert dag.get_next_task().id == "b"  # Unknown dependencies don't block
+
+    dag.add_task(Task(id="a", type=TaskType.IMPLEMENT, title="A", description="A"))
+    assert dag.get_next_task().id == "a"
+
+    dag.notify_status_change("a", TaskStatus.COMPLETED)
+    assert dag.get_next_task().id == "b"
+
 
 def test_priority_ordering(dag):
     """Test that tasks are ordered by priority."""
@@ -152,12 +247,66 @@ def test_get_progress(dag, sample_tasks):
     assert progress["completed"] == 0
 
     # Complete a task
-    dag.get_task("task1").status = TaskStatus.COMPLETED
+    dag.notify_status_change("task1", TaskStatus.COMPLETED)
     progress = dag.get_progress()
     assert progress["completed"] == 1
     assert progress["pending"] == 2
 
 
+def test_failure_blocks_downstream(dag, sample_tasks):
+    """Test that a failed task blocks its transitive dependents until retried."""
+    for task in sample_tasks:
+        dag.add_task(task)
+
+    dag.notify_status_change("task1", TaskStatus.FAILED)
+    assert {t.id for t in dag.get_blocked_tasks()} == {"task2", "task3"}
+    assert dag.get_progress()["blocked"] == 2
+
+    # Retrying the failed task releases its dependents
+    dag.notify_status_change("task1", TaskStatus.PENDING)
+    assert dag.get_blocked_tasks() == []
+    assert dag.get_task("task3").status == TaskStatus.PENDING
+    assert dag.get_next_task().id == "task1"
+
+
+def test_replacing_failed_task_releases_dependents(dag, sample_tasks):
+    """Test that re-adding a failed task unblocks what it had blocked."""
+    for task in sample_tasks:
+        dag.add_task(task)
+    dag.notify_status_change("task1", TaskStatus.FAILED)
+
+    dag.add_task(Task(id="task1", type=TaskType.SCAFFOLD, title="Task 1", description="Retry"))
+    assert dag.get_blocked_tasks() == []
+    assert dag.get_next_task().id == "task1"
+
+    dag.notify_status_change("task1", TaskStatus.COMPLETED)
+    assert dag.get_next_task().id == "task2"
+
+    # A replacement that is itself failed keeps them blocked
+    dag.add_task(
+        Task(
+            id="task1",
+            type=TaskType.SCAFFOLD,
+            title="Task 1",
+            description="Failed again",
+            status=TaskStatus.FAILED,
+        )
+    )
+    assert {t.id for t in dag.get_blocked_tasks()} == {"task2", "task3"}
+
+
+def test_removing_failed_task_releases_dependents(dag, sample_tasks):
+    """Test that removing a failed task unblocks what it had blocked."""
+    for task in sample_tasks:
+        dag.add_task(task)
+    dag.notify_status_change("task1", TaskStatus.FAILED)
+
+    dag.remove_task("task1")
+    assert dag.get_blocked_tasks() == []
+    assert dag.get_progress()["blocked"] == 0
+    assert dag.get_next_task().id == "task2"
+
+
 def test_is_complete(dag, sample_tasks):
     """Test completion detection."""
     for task in sample_tasks:
@@ -167,7 +316,7 @@ def test_is_complete(dag, sample_tasks):
 
     # Complete all tasks
     for task_id in ["task1", "task2", "task3"]:
-        dag.get_task(task_id).status = TaskStatus.COMPLETED
+        dag.notify_status_change(task_id, TaskStatus.COMPLETED)
 
     assert dag.is_complete()
 
@@ -180,3 +329,96 @@ def test_remove_task(dag, sample_tasks):
     dag.remove_task("task2")
     assert len(dag) == 2
     assert dag.get_task("task2") is None
+
+
+def test_readding_removed_task_relinks_dependents(dag):
+    """Test that a removed and re-added task holds its dependents back again."""
+    dag.add_task(Task(id="a", type=TaskType.TEST, title="A", description="A"))
+    dag.add_task(
+        Task(
+            id="b", type=TaskType.TEST, title="B", description="B", dependencies=["a"], priority=1
+        )
+    )
+
+    dag.remove_task("a")
+    assert dag.get_next_task().id == "b"
+
+    dag.add_task(Task(id="a", type=TaskType.TEST, title="A", description="A"))
+    assert dag.get_next_task().id == "a"
+    assert [t.id for t in dag.get_ready_tasks()] == ["a"]
+    assert [t.id for t in dag.topological_sort()] == ["a", "b"]
+    assert [t.id for t in dag.get_task_dependents("a")] == ["b"]
+
+    dag.notify_status_change("a", TaskStatus.COMPLETED)
+    assert dag.get_next_task().id == "b"
+
+
+def test_validate_deep_chain(dag):
+    """Test that validation handles chains deeper than the recursion limit."""
+    previous = None
+    for i in range(3000):
+        dag.add_task(
+            Task(
+                id=f"t{i}",
+                type=TaskType.IMPLEMENT,
+                title=f"Task {i}",
+                description="Chain link",
+                dependencies=[previous] if previous else [],
+            )
+        )
+        previous = f"t{i}"
+
+    assert dag.validate() == []
+
+
+def test_validate_reports_missing_dependency(dag):
+    """Test that validation reports dependencies on unknown tasks."""
+    dag.add_task(
+        Task(
+            id="orphan",
+            type=TaskType.IMPLEMENT,
+            title="Orphan",
+            description="Depends on nothing known",
+            dependencies=["ghost"],
+        )
+    )
+
+    assert dag.validate() == ["Task orphan depends on non-existent task ghost"]
+
+
+def test_add_task_interns_ids(dag):
+    """Test that task and dependency IDs share one string object per ID."""
+    dep_id = "".join(["task", "-a"])
+    dag.add_task(Task(id=dep_id, type=TaskType.IMPLEMENT, title="A", description="A"))
+    task = Task(
+        id="task-b",
+        type=TaskType.IMPLEMENT,
+        title="B",
+        description="B",
+        dependencies=["".join(["task", "-a"])],
+    )
+    dag.add_task(task)
+
+    assert task.dependencies[0] is dag.get_task("task-a").id
+
+
+def test_add_tasks_in_any_order(dag, sample_tasks, caplog):
+    """Test batch adding, dependents first, matches adding one by one."""
+    dag.add_tasks(reversed(sample_tasks))
+
+    assert [t.id for t in dag.topological_sort()] == ["task1", "task2", "task3"]
+    assert dag.get_next_task().id == "task1"
+    assert "unknown task" not in caplog.text
+
+
+def test_add_tasks_rejects_cycles(dag, sample_tasks):
+    """Test that a batch closing a cycle is rejected as a whole."""
+    dag.add_task(sample_tasks[0])
+    cyclic = [
+        Task(id="a", type=TaskType.TEST, title="A", description="A", dependencies=["b"]),
+        Task(id="b", type=TaskType.TEST, title="B", description="B", dependencies=["a"]),
+    ]
+
+    with pytest.raises(DAGCycleError):
+        dag.add_tasks(cyclic)
+    assert list(dag.tasks) == ["task1"]
@@ -0,0 +1,189 @@
+"""Tests for the Codex executor."""
+
+import asyncio
+
+import pytest
+
+from codex_agent.core.config import Config, ProjectConfig
+from codex_agent.core.models import LLMRequest, LLMResponse, Task, TaskType
+from codex_agent.executor.codex import CodexExecutor, CodexExecutorError, _CodeBlockStream
+
+
+@pytest.fixture
+def executor(tmp_path):
+    """Create an executor with a throwaway cache directory."""
+    config = Config(
+        project=ProjectConfig(name="test-project", stack="python-postgres"),
+        llm={"api_key": "test-key"},
+        cache_dir=tmp_path / "cache",
+    )
+    executor = CodexExecutor(config)
+    yield executor
+    executor.close()
+
+
+def test_extract_code_blocks(executor):
+    """Test extracting fenced code blocks with and without a language."""
+    content = "Intro\n```python\nprint(`x`)\n```\nThen\n```\nraw\n```\n"
+
+    assert executor.extract_code_blocks(content) == [
+        {"language": "python", "code": "print(`x`)"},
+        {"language": "text", "code": "raw"},
+    ]
+
+
+def test_extract_code_blocks_unterminated(executor):
+    """Test that an unclosed fence yields no block."""
+    assert executor.extract_code_blocks("```python\nprint(1)\n") == []
+
+
+@pytest.mark.asyncio
+async def test_response_cache_roundtrip(executor):
+    """Test that cached responses are stored and looked up by key."""
+    key = executor._get_cache_key("prompt", "model")
+
+    assert await executor._get_from_cache(key) is None
+    await executor._save_to_cache(key, "cached content")
+    assert await executor._get_from_cache(key) == "cached content"
+    assert (executor.cache_dir / CodexExecutor.CACHE_DB_NAME).exists()
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_call(executor, monkeypatch):
+    """Test that concurrent identical prompts make a single LLM call."""
+    calls = []
+
+    async def fake_call_llm(task, prompt):
+        calls.append(task.id)
+        await asyncio.sleep(0.01)
+        request = LLMRequest(task_id=task.id, model="test")
+        return request, LLMResponse(request_id=request.id, content="done", finish_reason="stop")
+
+    monkeypatch.setattr(executor, "_call_llm", fake_call_llm)
+    tasks = [
+        Task(id=f"t{i}", type=TaskType.IMPLEMENT, title="Same", description="Same prompt")
+        for i in range(3)
+    ]
+    results = await asyncio.gather(*(executor.execute_task(t, {}) for t in tasks))
+
+    assert len(calls) == 1
+    assert [content for content, _, _ in results] == ["done"] * 3
+    assert sorted(r.finish_reason for _, _, r in results) == ["coalesced", "coalesced", "stop"]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiter_survives_cancelled_leader(executor, monkeypatch):
+    """Test that cancelling the caller that made a shared call doesn't fail its waiters."""
+    calls = []
+    started = asyncio.Event()
+
+    async def fake_call_llm(task, prompt):
+        calls.append(task.id)
+        started.set()
+        await asyncio.sleep(0.01)
+        request = LLMRequest(task_id=task.id, model="test")
+        return request, LLMResponse(request_id=request.id, content="done", finish_reason="stop")
+
+    async def cache_miss(cache_key):
+        return None
+
+    monkeypatch.setattr(executor, "_call_llm", fake_call_llm)
+    # Look-ups that don't yield let the waiter reach the shared call in one step
+    monkeypatch.setattr(executor, "_get_from_cache", cache_miss)
+    leader_task, waiter_task = (
+        Task(id=task_id, type=TaskType.IMPLEMENT, title="Same", description="Same prompt")
+        for task_id in ("leader", "waiter")
+    )
+    leader = asyncio.create_task(executor.execute_task(leader_task, {}))
+    await started.wait()
+    waiter = asyncio.create_task(executor.execute_task(waiter_task, {}))
+    await asyncio.sleep(0)
+    assert "leader" in calls and "waiter" not in calls
+
+    leader.cancel()
+    content, _, response = await waiter
+
+    assert leader.cancelled()
+    assert content == "done"
+    assert response.finish_reason == "stop"
+    assert calls == ["leader", "waiter"]
+
+
+@pytest.mark.asyncio
+async def test_execute_tasks_limits_concurrency(executor, monkeypatch):
+    """Test that batch execution keeps results in order under the concurrency limit."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_call_llm(task, prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        request = LLMRequest(task_id=task.id, model="test")
+        return request, LLMResponse(request_id=request.id, content=task.id, finish_reason="stop")
+
+    monkeypatch.setattr(executor, "_call_llm", fake_call_llm)
+    tasks = [
+        Task(id=f"t{i}", type=TaskType.IMPLEMENT, title=f"Task {i}", description="Batch")
+        for i in range(10)
+    ]
+    results = await executor.execute_tasks(tasks, {})
+
+    assert [content for content, _, _ in results] == [task.id for task in tasks]
+    assert peak == executor.config.llm.max_concurrent_requests
+
+
+@pytest.mark.asyncio
+async def test_execute_tasks_cancels_remaining_calls_on_failure(executor, monkeypatch):
+    """Test that one failed call cancels the rest of the batch."""
+    finished = []
+
+    async def fake_call_llm(task, prompt):
+        if task.id == "bad":
+            raise CodexExecutorError("boom")
+        await asyncio.sleep(0.05)
+        finished.append(task.id)
+        request = LLMRequest(task_id=task.id, model="test")
+        return request, LLMResponse(request_id=request.id, content=task.id, finish_reason="stop")
+
+    monkeypatch.setattr(executor, "_call_llm", fake_call_llm)
+    tasks = [
+        Task(id=task_id, type=TaskType.IMPLEMENT, title=task_id, description="Batch")
+        for task_id in ("slow", "bad", "queued")
+    ]
+
+    with pytest.raises(CodexExecutorError, match="boom"):
+        await executor.execute_tasks(tasks, {})
+    await asyncio.sleep(0.1)
+    assert finished == []
+
+
+def test_streamed_code_blocks_match_full_extraction(executor):
+    """Test that incremental extraction finds the same blocks as the full text."""
+    content = "Intro\n```python\nx = `y`\n```\nthen\n```\nplain\n```\n``` unterminated"
+    scanner = _CodeBlockStream()
+    streamed = [block for char in content for block in scanner.feed(char)]
+
+    assert streamed == executor.extract_code_blocks(content)
+    assert len(streamed) == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_code_blocks_caches_response(executor, monkeypatch):
+    """Test that streamed blocks arrive incrementally and the response is cached."""
+    chunks = ["Here:\n``", "`py\nprint(1)\n`", "``\nDone"]
+
+    async def fake_stream_llm(task, prompt):
+        for chunk in chunks:
+            yield chunk
+
+    monkeypatch.setattr(executor, "_stream_llm", fake_stream_llm)
+    task = Task(id="t1", type=TaskType.IMPLEMENT, title="Stream", description="Stream it")
+
+    blocks = [block async for block in executor.stream_code_blocks(task, {})]
+    assert blocks == [{"language": "py", "code": "print(1)"}]
+
+    cache_key = executor._get_cache_key(executor._build_prompt(task, {}), executor.config.llm.model)
+    assert await executor._get_from_cache(cache_key) == "".join(chunks)
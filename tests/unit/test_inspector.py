@@ -0,0 +1,272 @@
+"""Tests for repository inspector."""
+
+import os
+from pathlib import Path
+
+from codex_agent.core.models import FileIndex, Symbol
+from codex_agent.inspector.repository import RepositoryInspector, _load_file
+
+
+def test_get_file_content_reuses_reads(tmp_path):
+    """Test that repeated reads of an unchanged file hit the loader cache."""
+    (tmp_path / "module.py").write_text("x = 1\n")
+    inspector = RepositoryInspector(tmp_path)
+    _load_file.cache_clear()
+
+    assert inspector.get_file_content("module.py") == "x = 1\n"
+    assert inspector.get_file_content("module.py") == "x = 1\n"
+    assert _load_file.cache_info().hits == 1
+
+
+def test_get_file_content_sees_changes(tmp_path):
+    """Test that a modified file is read again."""
+    path = tmp_path / "module.py"
+    path.write_text("x = 1\n")
+    inspector = RepositoryInspector(tmp_path)
+    assert inspector.get_file_content("module.py") == "x = 1\n"
+
+    path.write_text("x = 22\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert inspector.get_file_content("module.py") == "x = 22\n"
+    assert inspector.get_file_content("missing.py") is None
+
+    path.write_bytes(b"a = 1\r\nb = 2\rc = 3\n")
+    assert inspector.get_file_content("module.py") == "a = 1\nb = 2\nc = 3\n"
+
+
+def test_extract_python_symbols_with_line_ranges(tmp_path):
+    """Test that Python symbols carry their full line range and signature."""
+    source = (
+        "class Greeter:\n"
+        "    def greet(self, name: str = 'x') -> str:\n"
+        "        return name\n"
+        "\n"
+        "\n"
+        "async def main():\n"
+        "    pass\n"
+    )
+    inspector = RepositoryInspector(tmp_path)
+    symbols = inspector._extract_symbols(source, "python")
+
+    assert [(s.name, s.type, s.line_start, s.line_end) for s in symbols] == [
+        ("Greeter", "class", 1, 3),
+        ("greet", "function", 2, 3),
+        ("main", "function", 6, 7),
+    ]
+    assert symbols[1].signature == "def greet(self, name: str='x')"
+    assert symbols[2].signature == "async def main()"
+
+
+def test_extract_symbols_falls_back_on_syntax_error(tmp_path):
+    """Test that unparsable Python still yields regex-matched symbols."""
+    inspector = RepositoryInspector(tmp_path)
+    symbols = inspector._extract_symbols("def ok(a):\n    return (\n", "python")
+
+    assert [(s.name, s.line_start) for s in symbols] == [("ok", 1)]
+
+
+def test_extract_python_imports(tmp_path):
+    """Test that imports come from the syntax tree, including multi-line forms."""
+    source = (
+        "import os.path as osp, sys\n"
+        "from .models import (\n"
+        "    Task,\n"
+        "    TaskType,\n"
+        ")\n"
+        "def f():\n"
+        "    from json import loads\n"
+        "text = 'import not_a_module'\n"
+    )
+    inspector = RepositoryInspector(tmp_path)
+
+    imports, exports = inspector._extract_imports_exports(source, "python")
+    assert imports == ["os.path", "sys", ".models", "Task", "TaskType", "json", "loads"]
+    assert exports == []
+
+
+def test_extract_python_exports(tmp_path):
+    """Test that exports come from top-level ``__all__`` assignments."""
+    source = (
+        "__all__ = ['foo', 'bar']\n"
+        "__all__ += ('baz',)\n"
+        "__all__ += names\n"
+        "def f():\n"
+        "    __all__ = ['local']\n"
+    )
+    inspector = RepositoryInspector(tmp_path)
+
+    _, exports = inspector._extract_imports_exports(source, "python")
+    assert exports == ["foo", "bar", "baz"]
+
+    annotated = "__all__: list[str] = ['first']\n__all__ = ['second']\n"
+    assert inspector._extract_imports_exports(annotated, "python")[1] == ["second"]
+
+    # Indexed exports feed the importer/exporter links in related-file lookups
+    (tmp_path / "mod.py").write_text("__all__ = ['foo']\ndef foo():\n    pass\n")
+    (tmp_path / "user.py").write_text("from mod import foo\n")
+    inspector.index_repository(max_workers=1)
+    assert inspector.find_related_files("user.py") == ["mod.py"]
+
+
+def test_reindex_reuses_parse_of_unchanged_content(tmp_path, monkeypatch):
+    """Test that files with already-seen content are not parsed again."""
+    (tmp_path / "a.py").write_text("def f():\n    pass\n")
+    (tmp_path / "b.py").write_text("def f():\n    pass\n")
+    inspector = RepositoryInspector(tmp_path)
+    calls = []
+    extract = inspector._extract_source
+    monkeypatch.setattr(
+        inspector, "_extract_source", lambda *args: calls.append(args) or extract(*args)
+    )
+
+    inspector.index_repository()
+    inspector.index_repository()
+
+    assert len(calls) == 1
+    assert inspector.file_index["b.py"].symbols[0].name == "f"
+
+
+def test_parallel_index_matches_serial(tmp_path, monkeypatch):
+    """Test that pooled indexing builds the same index, in the same order."""
+    for i in range(6):
+        (tmp_path / f"mod{i}.py").write_text(f"def f{i}():\n    pass\n")
+    (tmp_path / "blob.bin").write_bytes(b"\xff\xfe\x00")
+
+    serial = RepositoryInspector(tmp_path)
+    serial.index_repository(max_workers=1)
+
+    monkeypatch.setattr(RepositoryInspector, "PARALLEL_MIN_FILES", 0)
+    parallel = RepositoryInspector(tmp_path)
+    parallel.index_repository(max_workers=2)
+
+    assert list(parallel.file_index) == list(serial.file_index)
+    assert parallel.file_index == serial.file_index
+    assert "blob.bin" not in parallel.file_index
+
+
+def test_persisted_index_skips_unchanged_files(tmp_path, monkeypatch):
+    """Test that a saved index is reused for files whose stat is unchanged."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "kept.py").write_text("def kept():\n    pass\n")
+    (repo / "edited.py").write_text("def before():\n    pass\n")
+    index_path = tmp_path / "file_index.json"
+    RepositoryInspector(repo, index_path=index_path).index_repository(max_workers=1)
+
+    edited = repo / "edited.py"
+    # A different size marks the file changed even at coarse mtime resolution
+    edited.write_text("def after_edit():\n    pass\n")
+
+    inspector = RepositoryInspector(repo, index_path=index_path)
+    built = []
+    build = inspector._build_file_index
+    monkeypatch.setattr(
+        inspector, "_build_file_index", lambda path: built.append(path.name) or build(path)
+    )
+    inspector.index_repository(max_workers=1)
+
+    assert built == ["edited.py"]
+    assert inspector.file_index["kept.py"].symbols[0].name == "kept"
+    assert inspector.file_index["edited.py"].symbols[0].name == "after_edit"
+
+
+def test_walk_prunes_excluded_directories(tmp_path):
+    """Test that excluded names are skipped at any depth, but not above the root."""
+    root = tmp_path / "build" / "repo"
+    (root / "pkg" / "__pycache__").mkdir(parents=True)
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / "pkg" / "mod.py").write_text("x = 1\n")
+    (root / "pkg" / "mod.pyc").write_bytes(b"")
+    (root / "pkg" / "__pycache__" / "mod.py").write_text("x = 1\n")
+    (root / "node_modules" / "dep" / "index.js").write_text("")
+
+    inspector = RepositoryInspector(root)
+    inspector.index_repository(max_workers=1)
+
+    assert list(inspector.file_index) == [str(Path("pkg") / "mod.py")]
+
+
+def test_find_related_files_scoring(tmp_path):
+    """Test related-file ranking by imports, exports, shared paths and symbols."""
+
+    def entry(path, imports=(), exports=(), symbols=()):
+        return FileIndex(
+            path=path,
+            language="python",
+            size_bytes=0,
+            hash="",
+            imports=list(imports),
+            exports=list(exports),
+            symbols=[Symbol(name=n, type="function", line_start=1, line_end=1) for n in symbols],
+        )
+
+    inspector = RepositoryInspector(tmp_path)
+    for file_index in [
+        entry("app/main.py", imports=["db"], exports=["run"], symbols=["setup"]),
+        entry("lib/db.py", exports=["db"]),  # 10
+        entry("app/cli.py", imports=["run"]),  # 10 + 2 for "app"
+        entry("app/other.py"),  # 2
+        entry("lib/setup.py", symbols=["setup", "setup"]),  # 5
+        entry("unrelated.py"),
+    ]:
+        inspector.file_index[file_index.path] = file_index
+
+    assert inspector.find_related_files("app/main.py") == [
+        "app/cli.py",
+        "lib/db.py",
+        "lib/setup.py",
+        "app/other.py",
+    ]
+    assert inspector.find_related_files("app/main.py", max_files=1) == ["app/cli.py"]
+    assert inspector.find_related_files("missing.py") == []
+
+
+def test_search_symbols_is_case_insensitive_and_refreshed(tmp_path):
+    """Test symbol search matching and that re-indexing refreshes results."""
+    (tmp_path / "a.py").write_text("def load_Config():\n    pass\n\nclass ConfigLoader:\n    pass\n")
+    inspector = RepositoryInspector(tmp_path)
+    inspector.index_repository(max_workers=1)
+
+    assert [s.name for _, s in inspector.search_symbols("CONFIG")] == [
+        "load_Config",
+        "ConfigLoader",
+    ]
+
+    (tmp_path / "b.py").write_text("def config():\n    pass\n")
+    inspector.index_repository(max_workers=1)
+    assert len(inspector.search_symbols("config")) == 3
+
+
+def test_index_names_are_interned(tmp_path):
+    """Test that identical import names across files share one string object."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("a.py", "b.py"):
+        (repo / name).write_text(f"import os\n{name[0]} = 1\n")
+    index_path = tmp_path / "file_index.json"
+    inspector = RepositoryInspector(repo, index_path=index_path)
+    inspector.index_repository(max_workers=1)
+
+    assert inspector.file_index["a.py"].imports[0] is inspector.file_index["b.py"].imports[0]
+
+    # Entries loaded back from the persisted index share strings too
+    reloaded = RepositoryInspector(repo, index_path=index_path)._load_index()
+    assert reloaded["a.py"].language is reloaded["b.py"].language
+
+
+def test_language_lookup_and_stats(tmp_path):
+    """Test language queries and stats share one lookup that re-indexing refreshes."""
+    (tmp_path / "a.py").write_text("def f():\n    pass\n")
+    (tmp_path / "b.js").write_text("const x = 1;\n")
+    inspector = RepositoryInspector(tmp_path)
+    inspector.index_repository(max_workers=1)
+
+    assert inspector.get_files_by_language("python") == ["a.py"]
+    assert inspector.get_files_by_language("rust") == []
+    assert inspector.get_index_stats()["by_language"] == {"python": 1, "javascript": 1}
+
+    (tmp_path / "c.py").write_text("x = 1\n")
+    inspector.index_repository(max_workers=1)
+    assert sorted(inspector.get_files_by_language("python")) == ["a.py", "c.py"]
@@ -0,0 +1,38 @@
+"""Tests for logging utilities."""
+
+import logging
+
+from codex_agent.utils.logging import MetricsCollector, _SharedFormatter
+
+
+def test_metrics_stats_cover_all_samples():
+    """Test that stats aggregate every sample while only recent ones are kept."""
+    collector = MetricsCollector(max_samples=3)
+    for duration in [5.0, 1.0, 9.0, 3.0, 2.0]:
+        collector.record_duration("llm", duration)
+
+    assert collector.get_stats("llm") == {"count": 5, "min": 1.0, "max": 9.0, "avg": 4.0}
+    assert list(collector.metrics["llm"]) == [9.0, 3.0, 2.0]
+    assert collector.get_stats("missing") == {}
+
+
+def test_metrics_reset():
+    """Test that reset clears durations and counters."""
+    collector = MetricsCollector()
+    collector.record_duration("llm", 1.0)
+    collector.increment_counter("calls", 2)
+    collector.reset()
+
+    assert collector.get_stats("llm") == {}
+    assert collector.get_counter("calls") == 0
+
+
+def test_file_formatter_formats_each_record_once():
+    """Test that handlers sharing the file formatter reuse its output."""
+    formatter = _SharedFormatter("%(levelname)s - %(message)s")
+    record = logging.LogRecord("codex", logging.ERROR, __file__, 1, "boom %s", ("now",), None)
+
+    assert formatter.format(record) == "ERROR - boom now"
+    record.msg, record.args = "changed", ()
+    assert formatter.format(record) == "ERROR - boom now"
+    assert logging.Formatter("%(message)s").format(record) == "changed"
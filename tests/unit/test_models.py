@@ -1,9 +1,13 @@
 """Tests for core data models."""
 
+from uuid import UUID
+
 import pytest
 from pydantic import ValidationError
 
 from codex_agent.core.models import (
+    AuditEvent,
+    EventType,
     LifecycleState,
     Task,
     TaskStatus,
@@ -28,6 +32,24 @@ def test_task_creation():
     assert len(task.id) > 0  # ULID generated
 
 
+def test_task_ids_are_unique_uuid4():
+    """Test that generated task IDs are distinct version 4 UUIDs."""
+    ids = {Task(type=TaskType.TEST, title="t", description="d").id for _ in range(100)}
+
+    assert len(ids) == 100
+    assert all(UUID(i).version == 4 for i in ids)
+
+
+def test_audit_event_ids_are_sortable_ulids():
+    """Test that audit event IDs are time-ordered ULIDs."""
+    first = AuditEvent(event_type=EventType.ERROR, actor="system")
+    second = AuditEvent(event_type=EventType.ERROR, actor="system")
+
+    assert len(first.id) == 26
+    assert set(first.id) <= set("0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+    assert first.id[:10] <= second.id[:10]
+
+
 def test_task_with_dependencies():
     """Test task with dependencies."""
     task = Task(
@@ -7,9 +7,9 @@ from codex_agent.core.models import LifecycleState
 from codex_agent.core.orchestrator import Orchestrator, StateTransitionError
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
-    """Create a test configuration."""
+    """Create a test configuration, shared by the module's tests since it is read-only."""
     return Config(project=ProjectConfig(name="test-project", stack="python-postgres"))
 
 
@@ -95,3 +95,22 @@ def test_is_terminal_state(orchestrator):
 
     orchestrator.transition(LifecycleState.FAILED)
     assert orchestrator.is_terminal_state()  # FAILED is terminal
+
+
+def test_orchestrator_has_no_instance_dict(orchestrator):
+    """Test that orchestrator state lives in slots."""
+    assert not hasattr(orchestrator, "__dict__")
+    with pytest.raises(AttributeError):
+        orchestrator.unknown_attribute = True
+
+
+def test_transition_history_is_bounded(orchestrator):
+    """Test that only the most recent transitions are kept in memory."""
+    for _ in range(Orchestrator.MAX_HISTORY):
+        orchestrator.transition(LifecycleState.PLANNING)
+        orchestrator.transition(LifecycleState.FAILED)
+        orchestrator.transition(LifecycleState.IDLE)
+
+    history = orchestrator.get_transition_history()
+    assert len(history) == Orchestrator.MAX_HISTORY
+    assert history[-1].to_state == LifecycleState.IDLE
@@ -0,0 +1,117 @@
+"""Tests for the state store."""
+
+import pytest
+
+from codex_agent.core.models import (
+    AuditEvent,
+    Checkpoint,
+    EventType,
+    LifecycleState,
+    StateTransition,
+    Task,
+    TaskStatus,
+    TaskType,
+)
+from codex_agent.persistence.store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a state store in a temporary directory."""
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+def test_store_uses_wal(store):
+    """Test that the shared connection is configured once for WAL."""
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert store._conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert store._conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+def test_lifecycle_state(store):
+    """Test reading and updating the lifecycle state."""
+    assert store.get_current_state() == LifecycleState.IDLE
+
+    store.update_state(LifecycleState.PLANNING)
+    assert store.get_current_state() == LifecycleState.PLANNING
+
+
+def test_task_roundtrip(store):
+    """Test saving, loading and deleting a task."""
+    task = Task(id="t1", type=TaskType.IMPLEMENT, title="Task", description="Do it")
+    task.status = TaskStatus.RUNNING
+    store.save_task(task)
+
+    loaded = store.get_task("t1")
+    assert loaded.title == "Task"
+    assert loaded.status == TaskStatus.RUNNING
+    assert [t.id for t in store.get_all_tasks()] == ["t1"]
+
+    assert store.delete_task("t1")
+    assert store.get_task("t1") is None
+
+
+def test_audit_events_filtered_by_type(store):
+    """Test that audit events can be filtered by type."""
+    store.save_audit_event(AuditEvent(event_type=EventType.LLM_CALL, actor="agent"))
+    store.save_audit_event(AuditEvent(event_type=EventType.ERROR, actor="system"))
+
+    events = store.get_audit_events(EventType.ERROR)
+    assert [e.actor for e in events] == ["system"]
+    assert len(store.get_audit_events()) == 2
+
+
+def test_non_object_event_data_is_ignored(store):
+    """Test that a JSON column holding something other than an object reads as empty."""
+    store.save_audit_event(AuditEvent(event_type=EventType.ERROR, actor="system"))
+    store._conn.execute("UPDATE audit_log SET event_data = '[1, 2]'")
+
+    assert [e.event_data for e in store.get_audit_events()] == [{}]
+
+
+def test_batch_writes(store):
+    """Test that batched transitions and events are all stored."""
+    store.save_transitions(
+        StateTransition(from_state=LifecycleState.IDLE, to_state=state, trigger="batch")
+        for state in [LifecycleState.PLANNING, LifecycleState.BUILDING]
+    )
+    store.save_audit_events(
+        AuditEvent(event_type=EventType.LLM_CALL, actor="agent", event_data={"n": n})
+        for n in range(3)
+    )
+
+    assert len(store.get_transition_history()) == 2
+    assert sorted(e.event_data["n"] for e in store.get_audit_events()) == [0, 1, 2]
+
+
+def test_filtered_audit_query_uses_index(store):
+    """Test that filtering audit events by type doesn't scan the table."""
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM audit_log WHERE event_type = ? "
+        "ORDER BY timestamp DESC LIMIT 10",
+        ("error",),
+    ).fetchall()
+
+    assert any("idx_audit_type_ts" in row[-1] for row in plan)
+
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM state_transitions ORDER BY timestamp DESC LIMIT 10"
+    ).fetchall()
+
+    assert any("idx_transitions_ts" in row[-1] for row in plan)
+
+
+def test_checkpoint_roundtrip(store):
+    """Test saving checkpoints and pruning old ones."""
+    task = Task(id="t1", type=TaskType.IMPLEMENT, title="Task", description="Do it")
+    for state in [LifecycleState.PLANNING, LifecycleState.BUILDING]:
+        store.save_checkpoint(Checkpoint(state=state, tasks=[task]))
+
+    latest = store.get_latest_checkpoint()
+    assert latest.state == LifecycleState.BUILDING
+    assert latest.tasks[0].id == "t1"
+    assert store.get_checkpoint(latest.id) == latest
+
+    assert store.cleanup_old_checkpoints(keep_count=1) == 1
@@ -0,0 +1,191 @@
+"""Tests for the PolicyEngine."""
+
+import pytest
+
+from codex_agent.core.config import Config, PolicyConfig, ProjectConfig, SafetyPolicyConfig
+from codex_agent.core.models import PolicySeverity
+from codex_agent.policy.engine import PolicyEngine
+
+
+@pytest.fixture(scope="module")
+def config():
+    """Create a test configuration, shared by the module's tests since it is read-only."""
+    return Config(project=ProjectConfig(name="test-project", stack="python-postgres"))
+
+
+def test_fused_secret_pattern_keeps_inline_flags(config):
+    """Test that per-pattern (?i) flags survive fusing."""
+    pattern = config.policies.security.compiled_secret_pattern
+
+    assert pattern is config.policies.security.compiled_secret_pattern
+    assert pattern.search("API_KEY = 'abc'")
+    assert pattern.search("Password = hunter2")
+    assert not pattern.search("nothing to see here")
+
+    # A verbose-mode comment must not swallow the scoped group's closing paren
+    verbose = Config(
+        project=config.project,
+        policies={"security": {"secret_patterns": [r"(?x) api _ key  # verbose", r"token"]}},
+    ).policies.security.compiled_secret_pattern
+    assert verbose.search("api_key").lastgroup == "_secret0"
+
+
+def test_scan_for_secrets_reports_source_pattern(config):
+    """Test that secret violations name the pattern that matched."""
+    engine = PolicyEngine(config)
+    violations = engine.validate_security(
+        {"files_content": {"app.py": "token = 'x'\npassword = 'y'\n"}}
+    )
+
+    assert [v.context["pattern"] for v in violations] == [
+        r"(?i)token\s*=",
+        r"(?i)password\s*=",
+    ]
+    assert all(v.blocking for v in violations)
+
+
+def test_no_secret_patterns(config):
+    """Test that an empty pattern list disables matching."""
+    config = Config(
+        project=config.project,
+        policies={"security": {"secret_patterns": []}},
+    )
+    engine = PolicyEngine(config)
+
+    assert engine.validate_security({"files_content": {"a.py": "api_key = 1"}}) == []
+
+
+def test_scan_for_secrets_with_capturing_patterns(config):
+    """Test that patterns with their own groups are still attributed correctly."""
+    config = Config(
+        project=config.project,
+        policies={"security": {"secret_patterns": [r"(ghp)_(\w+)", r"(?i)(aws)_key"]}},
+    )
+    engine = PolicyEngine(config)
+    violations = engine.validate_security({"files_content": {"a.py": "AWS_KEY ghp_abc"}})
+
+    assert [v.context["pattern"] for v in violations] == [r"(?i)(aws)_key", r"(ghp)_(\w+)"]
+    assert [v.context["match"] for v in violations] == ["AWS_KEY", "ghp_abc"]
+
+    # Numbered backreferences shift under fusion, so these are scanned one by one
+    patterns = [r"(ghp)_(\w+)", r"(['\"])secret\1", r"(?i)(aws)_key"]
+    config = Config(project=config.project, policies={"security": {"secret_patterns": patterns}})
+    assert config.policies.security.compiled_secret_pattern is None
+    engine = PolicyEngine(config)
+    violations = engine.validate_security(
+        {"files_content": {"a.py": "AWS_KEY 'secret' \"secret' ghp_abc"}}
+    )
+
+    assert [v.context["pattern"] for v in violations] == [patterns[2], patterns[1], patterns[0]]
+    assert [v.context["match"] for v in violations] == ["AWS_KEY", "'secret'", "ghp_abc"]
+
+
+@pytest.mark.parametrize(
+    "patterns, text, matches",
+    [
+        ([r"(?P<k>api)_key", r"(?P<k>tok)en"], "api_key token", ["api_key", "token"]),
+        ([r"(?x) api _ key  # verbose", r"token"], "api_key token", ["api_key", "token"]),
+    ],
+)
+def test_scan_for_secrets_with_fusion_edge_cases(config, patterns, text, matches):
+    """Test that patterns valid on their own still scan, whether or not they fuse."""
+    config = Config(project=config.project, policies={"security": {"secret_patterns": patterns}})
+    engine = PolicyEngine(config)
+    violations = engine.validate_security({"files_content": {"a.py": text}})
+
+    assert [v.context["match"] for v in violations] == matches
+
+
+def test_prohibited_paths_match_like_path_match(config):
+    """Test that precompiled globs keep Path.match semantics."""
+    config = Config(
+        project=config.project,
+        policies={"safety": {"prohibited_paths": ["secrets/", "*.pem", "config/*.yml", "/etc/*"]}},
+    )
+    engine = PolicyEngine(config)
+
+    assert engine._is_prohibited_path("app/secrets/db.txt")
+    assert engine._is_prohibited_path("certs/server.pem")
+    assert engine._is_prohibited_path("deploy/config/prod.yml")
+    assert engine._is_prohibited_path("/etc/hosts")
+    assert not engine._is_prohibited_path("config/nested/prod.yml")
+    assert not engine._is_prohibited_path("/srv/etc/hosts")
+    assert not engine._is_prohibited_path("src/main.py")
+
+
+def test_scan_for_secrets_in_files(config, tmp_path):
+    """Test that Path entries are scanned in place like their text."""
+    text = "token = 'x'\npassword = 'y'\n"
+    (tmp_path / "app.py").write_text(text)
+    (tmp_path / "empty.py").write_text("")
+    engine = PolicyEngine(config)
+
+    from_text = engine.validate_security({"files_content": {"app.py": text}})
+    from_file = engine.validate_security(
+        {"files_content": {"app.py": tmp_path / "app.py", "empty.py": tmp_path / "empty.py"}}
+    )
+
+    assert [v.context for v in from_file] == [v.context for v in from_text]
+
+
+def test_validate_safety_fail_fast(config):
+    """Test that prohibited paths are skipped past blown limits only with fail_fast."""
+    too_many = [f"src/f{i}.py" for i in range(20)] + [".env"]
+    context = {"modified_files": too_many, "diff_lines": 10}
+
+    engine = PolicyEngine(config)
+    assert [v.policy_name for v in engine.validate_safety(context)] == [
+        "max_files_per_task",
+        "prohibited_paths",
+    ]
+
+    fail_fast = Config(
+        project=config.project,
+        policies=PolicyConfig(safety=SafetyPolicyConfig(fail_fast=True)),
+    )
+    engine = PolicyEngine(fail_fast)
+    within = engine.validate_safety({"modified_files": [".env"], "diff_lines": 10})
+    assert [v.policy_name for v in within] == ["prohibited_paths"]
+
+    blown = engine.validate_safety(context)
+    assert [v.policy_name for v in blown] == ["max_files_per_task"]
+    assert engine.is_blocking(blown)
+
+
+def test_get_by_severity(config):
+    """Test filtering violations by minimum severity."""
+    engine = PolicyEngine(config)
+    violations = engine.validate_all(
+        {"modified_files": [".env"], "test_coverage": 0, "files_content": {}}
+    )
+
+    assert [v.policy_name for v in engine.get_by_severity(violations, PolicySeverity.ERROR)] == [
+        "prohibited_paths"
+    ]
+    assert len(engine.get_by_severity(violations, PolicySeverity.INFO)) == 2
+
+
+def test_format_violations(config):
+    """Test the human-readable violation report."""
+    engine = PolicyEngine(config)
+    violations = engine.validate_safety({"modified_files": [".env"]})
+
+    assert engine.format_violations([]) == "No policy violations found."
+    assert engine.format_violations(violations).split("\n") == [
+        "Policy Violations:",
+        "",
+        "🔴 [CRITICAL] SAFETY/prohibited_paths",
+        "   Attempted to modify prohibited path: .env",
+        "   Context: {'file': '.env'}",
+        "",
+    ]
+
+
+def test_prohibited_path_results_are_cached(config):
+    """Test that repeated paths are matched once per engine."""
+    engine = PolicyEngine(config)
+    engine.validate_safety({"modified_files": ["a.pem", "src/a.py"]})
+    engine.validate_safety({"modified_files": ["a.pem", "src/a.py"]})
+
+    info = engine._is_prohibited_path.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
@@ -0,0 +1,55 @@
+"""Tests for provider implementations."""
+
+import httpx
+import pytest
+
+from codex_agent.providers.github import _RetryTransport
+
+
+def _client(responses, calls):
+    """Build a client whose transport replays status codes and records methods."""
+
+    def handler(request):
+        calls.append(request.method)
+        status, headers = responses.pop(0)
+        return httpx.Response(status, headers=headers)
+
+    transport = _RetryTransport(httpx.MockTransport(handler), backoff_seconds=0)
+    return httpx.AsyncClient(transport=transport, base_url="https://api.github.test")
+
+
+@pytest.mark.asyncio
+async def test_retries_server_errors_for_idempotent_methods():
+    """Test that GETs are retried on 5xx until they succeed."""
+    calls = []
+    async with _client([(502, {}), (503, {}), (200, {})], calls) as client:
+        response = await client.get("/repos")
+
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_post_retried_only_when_rate_limited():
+    """Test that a POST is not resent after a 5xx but is after a rate limit."""
+    calls = []
+    async with _client([(500, {})], calls) as client:
+        assert (await client.post("/pulls", json={})).status_code == 500
+    assert calls == ["POST"]
+
+    calls = []
+    limited = (403, {"x-ratelimit-remaining": "0", "retry-after": "0"})
+    async with _client([limited, (201, {})], calls) as client:
+        assert (await client.post("/pulls", json={})).status_code == 201
+    assert calls == ["POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    """Test that the last response is returned once retries run out."""
+    calls = []
+    async with _client([(500, {})] * 4, calls) as client:
+        response = await client.get("/repos")
+
+    assert response.status_code == 500
+    assert len(calls) == 4